@@ -4,20 +4,36 @@ Opens The Zebra insurance website and keeps the browser session active.
 """
 
 from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import StaleElementReferenceException
-from typing import Optional
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+from typing import Callable, Optional, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
 import uvicorn
+import asyncio
+import json
+import os
+import queue
+import tempfile
+import threading
 import time
 import logging
 import random
 
+if TYPE_CHECKING:
+    import undetected_chromedriver as uc
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -26,32 +42,1083 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Human-like pacing (random sleeps, scrolls, mouse moves) for anti-bot runs.
+# Disabled by default; set HUMANIZE=1 in production to re-enable.
+HUMANIZE = os.getenv("HUMANIZE", "0") == "1"
+
+# "min" (default) injects navigator overrides only; "full" also hooks canvas and WebGL
+STEALTH_LEVEL = os.getenv("STEALTH_LEVEL", "min")
+
+# Hardcoded headless setting
+HEADLESS = True
+
+# Skip downloading images, fonts and analytics beacons; the flow only reads data-cy
+# elements and text. Set BLOCK_RESOURCES=0 to load pages in full.
+BLOCK_RESOURCES = os.getenv("BLOCK_RESOURCES", "1") == "1"
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*segment.io*", "*segment.com*", "*fullstory.com*", "*hotjar.com*",
+]
+
+# Number of warm browsers kept between /start runs, and how many runs may proceed in parallel
+DRIVER_POOL_SIZE = int(os.getenv("DRIVER_POOL_SIZE", "1"))
+
+# Runs a pooled browser serves before it is quit and relaunched, to cap memory growth
+DRIVER_MAX_USES = int(os.getenv("DRIVER_MAX_USES", "50"))
+
+# Launch the pool's browsers at startup so the first /start skips the cold launch. Off
+# by default, so a worker only imports undetected_chromedriver and starts Chrome once
+# a run needs a browser; set DRIVER_PREWARM=1 to trade startup cost for first-run latency.
+DRIVER_PREWARM = os.getenv("DRIVER_PREWARM", "0") == "1"
+
+# How long a start page preloaded by reset_driver may sit in an idle pooled browser and
+# still be used; an older one is reloaded so runs never start on a stale form or session
+START_PAGE_TTL = int(os.getenv("START_PAGE_TTL", "120"))
+
+# Root of the on-disk HTTP caches kept across browser launches and app restarts, one
+# subdirectory per pool slot since Chrome processes can't share a cache directory.
+# Set BROWSER_CACHE_DIR to an empty string to give each browser a throwaway cache.
+BROWSER_CACHE_DIR = os.getenv("BROWSER_CACHE_DIR", os.path.join(tempfile.gettempdir(), "rpa-browser-cache"))
+
+SITE_ORIGIN = "https://www.thezebra.com"
+START_URL = f"{SITE_ORIGIN}/insurance/car/prefill/start/"
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Explicit wait settings shared by every WebDriverWait in the flow
+WAIT_TIMEOUT = 30
+WAIT_POLL_FREQUENCY = 0.1
+WAIT_IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+# Timeout for probes of optional widgets, so a legitimately absent one fails fast
+QUICK_WAIT_TIMEOUT = 3
+
+# Locators for fixed page elements, built once instead of on every request
+RESIDENCE_OTHER_BUTTON = (By.CSS_SELECTOR, '[data-cy="radio-text-residence_ownership-0-3"]')
+PURCHASE_FUTURE_BUTTON = (By.CSS_SELECTOR, '[data-cy="radio-text-user_purchase_timeframe-0-FUTURE"]')
+CONTINUE_BUTTON = (By.CSS_SELECTOR, '[data-cy="primary-button_section-continue"]')
+ADDRESS_INPUT = (By.CSS_SELECTOR, '[data-cy="textinput-input-garaging_address"]')
+FIRST_NAME_INPUT = (By.CSS_SELECTOR, '[data-cy="textinput-input-first_name-0"]')
+LAST_NAME_INPUT = (By.CSS_SELECTOR, '[data-cy="textinput-input-last_name-0"]')
+DOB_INPUT = (By.CSS_SELECTOR, '[data-cy="textinput-input-date_of_birth-0"]')
+DROPDOWN_OPTION = (By.CSS_SELECTOR, '.custom-dropdown__option, [role="option"]')
+TRIM_INPUT = (By.CSS_SELECTOR, '[data-cy="dropdown-search-vehicles-0-submodel"]')
+ADD_ANOTHER_VEHICLE_NO = (By.CSS_SELECTOR, '[data-cy="radio-text-addAnother-vehicle-1-0"]')
+PRIMARY_USE_COMMUTING = (By.CSS_SELECTOR, '[data-cy="radio-text-vehicle-primary_use-0-0"]')
+MILES_INPUT = (By.CSS_SELECTOR, '[data-cy="textinput-input-miles-0"]')
+EMAIL_INPUT = (By.CSS_SELECTOR, '[data-cy="textinput-input-email-0"]')
+PHONE_INPUT = (By.CSS_SELECTOR, '[data-cy="textinput-input-phone-number-input"]')
+SHOW_QUOTES_BUTTON = (By.CSS_SELECTOR, '[data-cy="primary-button_show-quotes-minimum-desktop"]')
+
+# Coverage plan cards on the results page, and a text-based fallback for the Better one
+BASIC_PLAN_CARD = (By.CSS_SELECTOR, '[data-cy="basic-coverage-card-container"]')
+BETTER_PLAN_CARD = (By.CSS_SELECTOR, '[data-cy="better-coverage-card-container"]')
+BETTER_PLAN_CARD_FALLBACK = (By.XPATH, "//div[contains(@class, 'coverage-card-title') and contains(text(), 'Better')]/ancestor::label[contains(@class, 'custom-radio')]")
+
+# Quote cards (new layout first, then old) and the price elements inside them. The
+# selector list is for waits; extraction takes the first layout that matches, since the
+# old layout's data-cy substring can also match wrappers around several cards.
+QUOTE_CARD_SELECTORS = ['.results-card-v2__body', '[data-cy*="results-card_carrierCard"]']
+QUOTE_CARD_CSS = ', '.join(QUOTE_CARD_SELECTORS)
+QUOTE_PRICE_CSS = '[data-cy="results-card_price"], .rate__amount'
+
+# Loading indicators the results page shows while carriers are still being quoted; the
+# price waits only count quiet time while none of these is visible
+QUOTE_LOADING_CSS = '[class*="spinner"], [class*="skeleton"], [class*="loader"], [class*="loading"], [aria-busy="true"]'
+
+# How long the quote list must go unchanged before it is scraped, and the cap on that
+# wait. Carriers arrive with gaps of a second or more, so the window is kept wide.
+QUOTE_QUIET_MS = 3000
+QUOTE_SETTLE_TIMEOUT_MS = 20000
+
+# How long a plan switch may take to change the shown prices
+PLAN_SWITCH_TIMEOUT_MS = 10000
+
+# "$15k / $30k" bodily injury radio; a quoted CSS attribute value takes the "$" and "/"
+# as-is, and the second selector matches if the value's spacing ever changes
+BODILY_INJURY_15K_RADIO = (By.CSS_SELECTOR, ', '.join([
+    'div[data-cy="radio-text-current_bodily_injury_per_person-0-$15k / $30k"]',
+    'div[data-cy*="current_bodily_injury_per_person"][data-cy*="$15k"]',
+]))
+
+# Form fields filled by run_form_actions(), in page order, as (kind, target, value, label):
+#   "radio": click the radio whose text data-cy is target
+#   "radio_if_unset": same, unless the radio is already selected; failures are logged only
+#   "click": click the element at the target locator
+#   "text": set the input at the target locator to value
+#   "dropdown": select value in the search dropdown whose data-cy is target; failures are logged only
+STEP9_ACTIONS = [
+    ("radio", "radio-text-vehicle-ownership-0-0", None, "Vehicle ownership"),
+    ("click", PRIMARY_USE_COMMUTING, None, "Primary use (commuting)"),
+    ("text", MILES_INPUT, "1000", "Miles"),
+    ("dropdown", "dropdown-search-vehicle-ownership_length-0", "1 month - 1 year", "Ownership duration"),
+]
+STEP10_ACTIONS = [
+    ("radio", "radio-text-gender-0-0", None, "Gender (male)"),
+    ("radio", "radio-text-marital_status-0-0", None, "Marital status (single)"),
+    ("radio", "radio-text-credit_score-0-1", None, "Credit score (good)"),
+    ("radio_if_unset", "radio-text-education-0-0", None, "Education"),
+    ("dropdown", "dropdown-search-employment-0", "Not employed within the last 12 months", "Employment"),
+    ("dropdown", "dropdown-search-current_carrier-0", "other", "Current carrier"),
+    ("radio_if_unset", "radio-text-insured_length-0-0", None, "Insured length"),
+    ("click", BODILY_INJURY_15K_RADIO, None, "Bodily injury ($15k / $30k)"),
+    ("radio_if_unset", "radio-text-violations-0", None, "Violations"),
+    ("text", EMAIL_INPUT, "moazam@gmail.com", "Email"),
+    ("text", PHONE_INPUT, "2019756595", "Phone number"),
+    ("radio", "radio-text-has_military_affiliation-false", None, "Military affiliation"),
+]
+
+# First address autocomplete suggestion, as one comma-joined CSS selector
+ADDRESS_SUGGESTION_LOCATOR = (By.CSS_SELECTOR, ', '.join([
+    '#address-suggestion-0',
+    '.address-suggestion.suggestion-selected',
+    '#ex-list-box li:first-child',
+    'ul[role="listbox"] li:first-child',
+    '.autocomplete-option:first-child',
+]))
+# Tried only if the CSS selector never matches
+ADDRESS_SUGGESTION_XPATH_FALLBACKS = (
+    (By.XPATH, "//li[@role='option'][1]"),
+    (By.XPATH, "//ul[contains(@class, 'autocomplete')]//li[1]"),
+)
+
+# Stealth scripts evaluated on every new document. Built once at import time so
+# start_bot can inject them with a single Page.addScriptToEvaluateOnNewDocument call.
+WEBDRIVER_STEALTH_JS = '''
+    // Remove webdriver property
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+'''
+
+HEADLESS_STEALTH_JS = '''
+    // Override Chrome runtime
+    window.navigator.chrome = {
+        runtime: {},
+        loadTimes: function() {},
+        csi: function() {},
+        app: {}
+    };
+    
+    // Override permissions
+    const originalQuery = window.navigator.permissions.query;
+    window.navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications' ?
+            Promise.resolve({ state: Notification.permission }) :
+            originalQuery(parameters)
+    );
+'''
+
+FINGERPRINT_STEALTH_JS = '''
+    // Additional fingerprinting protection
+    Object.defineProperty(navigator, 'hardwareConcurrency', {
+        get: () => 8
+    });
+    Object.defineProperty(navigator, 'deviceMemory', {
+        get: () => 8
+    });
+    
+    // Override plugins
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5]
+    });
+    
+    // Override languages
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['en-US', 'en']
+    });
+    
+    // Override headless detection
+    Object.defineProperty(navigator, 'maxTouchPoints', {
+        get: () => 0
+    });
+'''
+
+# Canvas/WebGL overrides. The toDataURL hook perturbs every pixel of the canvas in JS
+# on each call, which costs renderer CPU, so it is only injected when STEALTH_LEVEL=full.
+CANVAS_WEBGL_STEALTH_JS = '''
+    // Canvas fingerprinting protection
+    const originalToDataURL = HTMLCanvasElement.prototype.toDataURL;
+    HTMLCanvasElement.prototype.toDataURL = function(type) {
+        const context = this.getContext('2d');
+        if (context) {
+            const imageData = context.getImageData(0, 0, this.width, this.height);
+            for (let i = 0; i < imageData.data.length; i += 4) {
+                imageData.data[i] += Math.floor(Math.random() * 3) - 1;
+            }
+            context.putImageData(imageData, 0, 0);
+        }
+        return originalToDataURL.apply(this, arguments);
+    };
+    
+    // WebGL fingerprinting protection
+    const getParameter = WebGLRenderingContext.prototype.getParameter;
+    WebGLRenderingContext.prototype.getParameter = function(parameter) {
+        if (parameter === 37445) {
+            return 'Intel Inc.';
+        }
+        if (parameter === 37446) {
+            return 'Intel Iris OpenGL Engine';
+        }
+        return getParameter.apply(this, arguments);
+    };
+'''
+
+# navigator.webdriver is only redefined once: a second defineProperty on the same
+# non-configurable property would throw and abort the rest of the combined script.
+# The canvas/WebGL hooks are only added at STEALTH_LEVEL=full.
+STEALTH_JS = (WEBDRIVER_STEALTH_JS + HEADLESS_STEALTH_JS + FINGERPRINT_STEALTH_JS
+              + (CANVAS_WEBGL_STEALTH_JS if STEALTH_LEVEL == "full" else ""))
+HEADED_STEALTH_JS = (WEBDRIVER_STEALTH_JS + FINGERPRINT_STEALTH_JS
+                     + (CANVAS_WEBGL_STEALTH_JS if STEALTH_LEVEL == "full" else ""))
+
+# True once the document has finished loading and React has mounted interactive elements
+PAGE_READY_JS = """
+    return document.readyState === 'complete' &&
+        document.querySelectorAll('[data-cy], [class*="radio"], button, input').length > 0;
+"""
+
+# Locates the "I want to compare my current insurance" button by data-cy, then by
+# its text node, then by the innermost div containing the text (XPath lookups stop
+# at the first match instead of materializing every div); scrolls to and clicks it.
+# Returns true once clicked so it can be polled by WebDriverWait.
+FIND_AND_CLICK_COMPARE_BUTTON_JS = '''
+    function findAndClickCompareButton() {
+        var el = document.querySelector('[data-cy="radio-text-help_today-compare_current"]');
+        if (!el) {
+            el = document.evaluate(
+                "//div[contains(text(), 'I want to compare my current insurance')]",
+                document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+            ).singleNodeValue;
+        }
+        if (!el) {
+            el = document.evaluate(
+                "//div[contains(., 'compare my current insurance') and not(.//div[contains(., 'compare my current insurance')])]",
+                document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+            ).singleNodeValue;
+        }
+        if (!el) {
+            return false;
+        }
+        el.scrollIntoView({block: 'center'});
+        el.click();
+        return true;
+    }
+    return findAndClickCompareButton();
+'''
+
+# Scrolls to and clicks each selector in arguments[0] in order. Stops at the first
+# selector that is not in the DOM and returns it, or returns null if all were clicked.
+BULK_RADIO_CLICK_JS = '''
+    var selectors = arguments[0];
+    for (var i = 0; i < selectors.length; i++) {
+        var el = document.querySelector(selectors[i]);
+        if (!el) {
+            return selectors[i];
+        }
+        el.scrollIntoView({block: 'center'});
+        el.click();
+    }
+    return null;
+'''
+
+# Promise that resolves true once every selector in the JSON list matches an element,
+# or false after the timeout. Filled in with (selectors_json, timeout_ms).
+AWAIT_SELECTORS_JS = '''
+    new Promise((resolve) => {
+        const selectors = %s;
+        const ready = () => selectors.every((selector) => document.querySelector(selector));
+        if (ready()) {
+            return resolve(true);
+        }
+        const observer = new MutationObserver(() => {
+            if (ready()) {
+                observer.disconnect();
+                resolve(true);
+            }
+        });
+        observer.observe(document, {childList: true, subtree: true});
+        setTimeout(() => {
+            observer.disconnect();
+            resolve(false);
+        }, %d);
+    })
+'''
+
+# Promise that clicks the element matching a selector as soon as it exists and is not
+# disabled, resolving true, or false after the timeout. A MutationObserver watches
+# inserted nodes and "disabled" attribute flips, so no polling is involved. The page
+# records the click in window.__rpaEnabledClicked, which ENABLED_CLICK_DONE_JS reads if
+# the evaluate is cut short. Filled in with (selector_json, timeout_ms).
+AWAIT_ENABLED_CLICK_JS = '''
+    new Promise((resolve) => {
+        const selector = %s;
+        window.__rpaEnabledClicked = false;
+        const tryClick = () => (window.__rpaEnabledClicked = window.__rpa.click(selector) === 'ok');
+        if (tryClick()) {
+            return resolve(true);
+        }
+        const observer = new MutationObserver(() => {
+            if (tryClick()) {
+                observer.disconnect();
+                resolve(true);
+            }
+        });
+        observer.observe(document, {childList: true, subtree: true, attributes: true, attributeFilter: ['disabled']});
+        setTimeout(() => {
+            observer.disconnect();
+            resolve(false);
+        }, %d);
+    })
+'''
+
+# Whether the last AWAIT_ENABLED_CLICK_JS clicked. A document without the flag is a new
+# page, so the click happened and navigated away.
+ENABLED_CLICK_DONE_JS = "return window.__rpaEnabledClicked !== false;"
+
+# Promise that resolves true once the selector matches, no element matching the busy
+# selector (or null) is visible, and the DOM has gone quiet_ms without a mutation; false
+# after the timeout. Used to tell when lists that render in several passes (e.g. quote
+# cards) have finished. Filled in with (selector_json, busy_json, quiet_ms, timeout_ms).
+AWAIT_DOM_QUIET_JS = '''
+    new Promise((resolve) => {
+        const selector = %s;
+        const busy = %s;
+        const quietMs = %d;
+        const isBusy = () => busy !== null && Array.prototype.some.call(
+            document.querySelectorAll(busy), (el) => el.getClientRects().length > 0);
+        let quietTimer = null;
+        const finish = (value) => {
+            observer.disconnect();
+            clearTimeout(quietTimer);
+            clearTimeout(deadline);
+            resolve(value);
+        };
+        const restartQuiet = () => {
+            clearTimeout(quietTimer);
+            if (document.querySelector(selector) && !isBusy()) {
+                quietTimer = setTimeout(() => finish(true), quietMs);
+            }
+        };
+        const observer = new MutationObserver(restartQuiet);
+        // Class and aria-busy changes count too, since loaders are often hidden by class
+        observer.observe(document, {
+            childList: true, subtree: true, characterData: true,
+            attributes: true, attributeFilter: ['class', 'aria-busy']
+        });
+        const deadline = setTimeout(() => finish(false), %d);
+        restartQuiet();
+    })
+'''
+
+# Joined text of every element matching arguments[0], used to snapshot the shown prices
+SELECTOR_TEXT_JS = '''
+    return Array.prototype.map.call(document.querySelectorAll(arguments[0]), function (el) {
+        return el.textContent.trim();
+    }).join('|');
+'''
+
+# Promise that resolves true once the joined text of the elements matching the selector
+# differs from the snapshot taken with SELECTOR_TEXT_JS, or false after the timeout.
+# Filled in with (selector_json, snapshot_json, timeout_ms).
+AWAIT_TEXT_CHANGE_JS = '''
+    new Promise((resolve) => {
+        const selector = %s;
+        const snapshot = %s;
+        const current = () => Array.prototype.map.call(
+            document.querySelectorAll(selector), (el) => el.textContent.trim()).join('|');
+        const finish = (value) => {
+            observer.disconnect();
+            clearTimeout(deadline);
+            resolve(value);
+        };
+        const observer = new MutationObserver(() => {
+            if (current() !== snapshot) {
+                finish(true);
+            }
+        });
+        observer.observe(document, {childList: true, subtree: true, characterData: true});
+        const deadline = setTimeout(() => finish(false), %d);
+        if (current() !== snapshot) {
+            finish(true);
+        }
+    })
+'''
+
+# Reads every quote card on the page in one call and returns [{company, price, structure}]
+# in page order; price is null for cards without one. Cards are found with the first
+# selector in arguments[0] that matches anything, or by walking up from each price
+# element if none match. Prices come from the new layout's price/period elements, then
+# from the old layout's .rate containers.
+EXTRACT_QUOTE_CARDS_JS = '''
+    var text = function (el) { return el ? el.innerText.trim() : ''; };
+    var cards = [];
+    for (var s = 0; s < arguments[0].length && !cards.length; s++) {
+        cards = Array.prototype.slice.call(document.querySelectorAll(arguments[0][s]));
+    }
+    if (!cards.length) {
+        document.querySelectorAll('[data-cy="results-card_price"]').forEach(function (priceEl) {
+            var card = priceEl.parentElement && priceEl.parentElement.closest('div[class*="results-card"], div[class*="card-body"]');
+            if (card) {
+                cards.push(card);
+            }
+        });
+    }
+    var fromRate = function (rate, amountText) {
+        var dollar = text(rate.querySelector('.rate__dollar')) || '$';
+        return (dollar + amountText + text(rate.querySelector('.rate__period'))).trim();
+    };
+    return cards.map(function (card) {
+        var logo = card.querySelector('img[data-cy="results-card_logo"]') || card.querySelector('img[data-cy*="card-logo"]');
+        var company = (logo && logo.getAttribute('alt') || '').replace(/ logo/g, '').replace(/Logo/g, '').replace(/logo/g, '').trim();
+        var price = null;
+        var structure = null;
+        var amountText = text(card.querySelector('[data-cy="results-card_price"]'));
+        if (amountText) {
+            var periodEl = card.querySelector('.results-card-v2__currency--period');
+            price = ('$' + amountText + (periodEl ? text(periodEl) : '/mo')).trim();
+            structure = 'new structure';
+        }
+        if (!price) {
+            var rates = card.querySelectorAll('div[class*="rate"]');
+            for (var i = 0; i < rates.length && !price; i++) {
+                amountText = text(rates[i].querySelector('.rate__amount'));
+                if (amountText) {
+                    price = fromRate(rates[i], amountText);
+                    structure = 'old structure';
+                }
+            }
+        }
+        if (!price) {
+            var amounts = card.querySelectorAll('.rate__amount');
+            for (var j = 0; j < amounts.length && !price; j++) {
+                amountText = text(amounts[j]);
+                var rate = amountText && amounts[j].parentElement && amounts[j].parentElement.closest('div[class*="rate"]');
+                if (rate) {
+                    price = fromRate(rate, amountText);
+                    structure = 'CSS';
+                }
+            }
+        }
+        return {company: company || 'Unknown', price: price, structure: structure};
+    });
+'''
+
+# DOM helpers registered on every new document as a non-enumerable window.__rpa, so
+# the scripts sent per action are one-line calls that V8 parses almost for free.
+#   click(selector): scroll to and click; returns 'ok', 'missing' or 'disabled'
+#   setValue(target, value): set an input, given as a selector or an element, through the
+#       native value setter, so React's controlled-input state sees the change, and fire
+#       "input" and "change"; false if missing
+#   fillAll(fields): setValue each [selector, value] pair in order; returns the first
+#       selector not in the DOM, or null if all were set
+#   focus(selector): focus an element so CDP key events go to it; false if missing
+#   control(selector): the custom dropdown control around the input matching selector,
+#       or null
+#   selectedText(selector): trimmed text of the value selected in the custom dropdown
+#       whose input matches selector, or '' if nothing is selected
+#   radioStates(dataCys): {data-cy: state}, true if the radio's label has the
+#       is-selected class, false if not, null if the radio is not in the DOM
+RPA_CONTROLLER_JS = '''
+    (() => {
+        const valueSetter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+        const find = (selector) => document.querySelector(selector);
+        Object.defineProperty(window, '__rpa', {
+            value: {
+                click(selector) {
+                    const el = find(selector);
+                    if (!el) return 'missing';
+                    if (el.disabled) return 'disabled';
+                    el.scrollIntoView({block: 'center'});
+                    el.click();
+                    return 'ok';
+                },
+                setValue(target, value) {
+                    const el = typeof target === 'string' ? find(target) : target;
+                    if (!el) return false;
+                    valueSetter.call(el, value);
+                    el.dispatchEvent(new Event('input', {bubbles: true}));
+                    el.dispatchEvent(new Event('change', {bubbles: true}));
+                    return true;
+                },
+                fillAll(fields) {
+                    const missing = fields.find(([selector, value]) => !this.setValue(selector, value));
+                    return missing ? missing[0] : null;
+                },
+                focus(selector) {
+                    const el = find(selector);
+                    if (!el) return false;
+                    el.focus();
+                    return true;
+                },
+                control(selector) {
+                    const input = find(selector);
+                    return input && input.closest('.custom-dropdown__control');
+                },
+                selectedText(selector) {
+                    const input = find(selector);
+                    const control = input && input.closest('.custom-dropdown__control');
+                    const value = control && control.querySelector('.custom-dropdown__single-value');
+                    return value ? value.textContent.trim() : '';
+                },
+                radioStates(dataCys) {
+                    const states = {};
+                    dataCys.forEach((dataCy) => {
+                        const el = find('[data-cy="' + dataCy + '"]');
+                        const label = el && el.closest('label');
+                        states[dataCy] = el ? !!label && label.classList.contains('is-selected') : null;
+                    });
+                    return states;
+                },
+            },
+            enumerable: false,
+        });
+    })();
+'''
+
+# Calls into window.__rpa; see RPA_CONTROLLER_JS for arguments and return values
+SET_INPUT_VALUE_JS = "return window.__rpa.setValue(arguments[0], arguments[1]);"
+BULK_FILL_INPUTS_JS = "return window.__rpa.fillAll(arguments[0]);"
+RADIO_SELECTED_STATES_JS = "return window.__rpa.radioStates(arguments[0]);"
+DROPDOWN_SELECTED_TEXT_JS = "return window.__rpa.selectedText(arguments[0]);"
+DROPDOWN_CONTROL_JS = "return window.__rpa.control(arguments[0]);"
+FOCUS_ELEMENT_JS = "return window.__rpa.focus(arguments[0]);"
+
+# Centers arguments[0] with an instant scroll unless it is already fully inside the
+# viewport. Returns true if no scroll was needed.
+SCROLL_IF_NEEDED_JS = '''
+    var el = arguments[0];
+    var r = el.getBoundingClientRect();
+    var visible = r.top >= 0 && r.bottom <= window.innerHeight;
+    if (!visible) {
+        el.scrollIntoView({block: 'center'});
+    }
+    return visible;
+'''
+
+# Clicks the open dropdown option whose text equals arguments[0] (case-insensitive),
+# or else the first one containing it. Returns false if no option matches yet.
+CLICK_MATCHING_OPTION_JS = '''
+    var wanted = String(arguments[0]).trim().toLowerCase();
+    var options = Array.prototype.slice.call(
+        document.querySelectorAll('.custom-dropdown__option, [role="option"]'));
+    var texts = options.map(function (o) { return o.textContent.trim().toLowerCase(); });
+    var index = texts.indexOf(wanted);
+    if (index < 0) {
+        index = texts.findIndex(function (t) { return t.indexOf(wanted) >= 0; });
+    }
+    if (index < 0) {
+        return false;
+    }
+    options[index].click();
+    return true;
+'''
+
+# Centers arguments[0] in the viewport and clicks it in the same script call
+FAST_CLICK_JS = '''
+    arguments[0].scrollIntoView({block: 'center'});
+    arguments[0].click();
+'''
+
+# Opens the custom dropdown whose input matches arguments[0] and clicks the option whose
+# text equals arguments[1] (case-insensitive). Resolves true once clicked, or false if
+# the input or option is not found within arguments[2] milliseconds. react-select opens
+# its menu on mousedown of the control and selects on click of an option.
+SELECT_DROPDOWN_OPTION_JS = '''
+    var selector = arguments[0];
+    var wanted = String(arguments[1]).trim().toLowerCase();
+    var deadline = Date.now() + arguments[2];
+    return new Promise(function (resolve) {
+        (function poll() {
+            var input = document.querySelector(selector);
+            var control = input && input.closest('.custom-dropdown__control');
+            if (control && !document.querySelector('.custom-dropdown__menu')) {
+                control.dispatchEvent(new MouseEvent('mousedown', {bubbles: true, button: 0}));
+            }
+            var options = document.querySelectorAll('.custom-dropdown__option');
+            for (var i = 0; i < options.length; i++) {
+                if (options[i].textContent.trim().toLowerCase() === wanted) {
+                    options[i].click();
+                    resolve(true);
+                    return;
+                }
+            }
+            if (Date.now() > deadline) {
+                resolve(false);
+                return;
+            }
+            setTimeout(poll, 50);
+        })();
+    });
+'''
+
+# Stamps a preloaded start page with the time it finished loading
+MARK_PRELOADED_JS = "window.__rpaPreloadedAt = Date.now();"
+
+# Seconds since the start page at arguments[0] was preloaded, or null if the current
+# document is not a preloaded start page
+PRELOAD_AGE_JS = '''
+    if (location.href.split('?')[0] !== arguments[0] || !window.__rpaPreloadedAt) {
+        return null;
+    }
+    return (Date.now() - window.__rpaPreloadedAt) / 1000;
+'''
+
+# Marks the current document before a click that navigates. AWAIT_NAVIGATION_JS then
+# resolves true once the marker is gone (full page load) or the URL changed (client-side
+# route), and the document has finished loading. It re-checks on every DOM mutation,
+# readyState change and history pop, and resolves false after %d milliseconds.
+MARK_NAVIGATION_JS = '''
+    window.__rpaNavMarker = true;
+    window.__rpaNavUrl = location.href;
+'''
+AWAIT_NAVIGATION_JS = '''
+    new Promise((resolve) => {
+        const navigated = () => (!window.__rpaNavMarker || location.href !== window.__rpaNavUrl)
+            && document.readyState === 'complete';
+        if (navigated()) {
+            resolve(true);
+            return;
+        }
+        const check = () => {
+            if (navigated()) {
+                finish(true);
+            }
+        };
+        const observer = new MutationObserver(check);
+        observer.observe(document, {childList: true, subtree: true});
+        document.addEventListener('readystatechange', check);
+        window.addEventListener('popstate', check);
+        const timer = setTimeout(() => finish(false), %d);
+        function finish(value) {
+            observer.disconnect();
+            document.removeEventListener('readystatechange', check);
+            window.removeEventListener('popstate', check);
+            clearTimeout(timer);
+            resolve(value);
+        }
+    })
+'''
+
 app = FastAPI(title="Selenium Bot API")
 
-# Global variable to store the browser instance
-driver: Optional[uc.Chrome] = None
+# Browsers currently running a /start, oldest first
+active_drivers: list = []
+active_drivers_lock = threading.Lock()
+
+# undetected_chromedriver and ActionChains are imported on first use, so workers
+# that never drive a browser don't pay for loading them at startup
+_uc_module = None
+_action_chains_class = None
+
+
+def _get_uc():
+    """Import undetected_chromedriver on first call and return the module."""
+    global _uc_module
+    if _uc_module is None:
+        import undetected_chromedriver as uc_mod
+        _uc_module = uc_mod
+    return _uc_module
+
+
+def _get_action_chains():
+    """Import ActionChains on first call and return the class."""
+    global _action_chains_class
+    if _action_chains_class is None:
+        from selenium.webdriver.common.action_chains import ActionChains
+        _action_chains_class = ActionChains
+    return _action_chains_class
+
+# Pre-generated random delays keyed by (min, max), cycled by a shared index.
+# DELAY_TABLE_SIZE must be a power of two.
+DELAY_TABLE_SIZE = 1024
+_delay_tables: dict = {}
+_delay_index = 0
+
+# Worker threads for /start runs, one per pooled browser; extra requests queue here
+bot_executor = ThreadPoolExecutor(max_workers=DRIVER_POOL_SIZE, thread_name_prefix="bot")
+
+# Threads that reset finished browsers and return them to the pool after the response
+# is sent. Kept apart from bot_executor so a reset never queues behind a run waiting
+# for the browser it frees.
+reset_executor = ThreadPoolExecutor(max_workers=DRIVER_POOL_SIZE, thread_name_prefix="reset")
+
+
+class DelayBudget:
+    """
+    Deferred human-like pauses, paid off before the next WebDriver command.
+    
+    defer() pushes a per-thread deadline forward instead of sleeping. settle() is
+    called ahead of every WebDriver command and sleeps only for whatever part of the
+    deadline has not already elapsed in Python work or earlier waits. The deadline lives
+    on the worker thread, so reset() is called as each run starts.
+    """
+    
+    def __init__(self):
+        self._local = threading.local()
+    
+    def defer(self, seconds: float):
+        """Add a pause to be taken before the next WebDriver command."""
+        now = time.monotonic()
+        self._local.deadline = max(getattr(self._local, "deadline", 0.0), now) + seconds
+    
+    def settle(self):
+        """Sleep for the unexpired part of any deferred pause."""
+        remaining = getattr(self._local, "deadline", 0.0) - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+    
+    def reset(self):
+        """Drop any pause still owed on this thread, e.g. by a previous run."""
+        self._local.deadline = 0.0
+
+
+delay_budget = DelayBudget()
+
+
+def pregenerated_delay(min_seconds: float, max_seconds: float) -> float:
+    """
+    Return the next delay from a pre-generated table for this (min, max) range.
+    
+    Each table is filled with random.uniform values on first use and cycled
+    afterwards, so the hot path is a dict lookup and an index bump.
+    
+    Args:
+        min_seconds: Minimum delay in seconds
+        max_seconds: Maximum delay in seconds
+        
+    Returns:
+        float: Delay in seconds
+    """
+    global _delay_index
+    key = (min_seconds, max_seconds)
+    table = _delay_tables.get(key)
+    if table is None:
+        table = [random.uniform(min_seconds, max_seconds) for _ in range(DELAY_TABLE_SIZE)]
+        _delay_tables[key] = table
+    delay = table[_delay_index & (DELAY_TABLE_SIZE - 1)]
+    _delay_index += 1
+    return delay
 
 
 def human_delay(min_seconds: float = 0.2, max_seconds: float = 0.8):
     """
-    Add a random human-like delay between actions.
+    Add a random human-like delay between actions. No-op unless HUMANIZE is enabled.
+    
+    The delay is deferred to delay_budget and taken just before the next WebDriver
+    command, so time spent in between counts toward it.
     
     Args:
         min_seconds: Minimum delay in seconds
         max_seconds: Maximum delay in seconds
     """
-    delay = random.uniform(min_seconds, max_seconds)
-    time.sleep(delay)
+    if not HUMANIZE:
+        return
+    delay_budget.defer(pregenerated_delay(min_seconds, max_seconds))
+
+
+def await_selectors(driver_instance, selectors, timeout_ms: int) -> Optional[bool]:
+    """
+    Block until every selector matches an element, using an in-page MutationObserver.
+    
+    The promise is awaited through a single CDP Runtime.evaluate call, so the element
+    is detected as soon as it is inserted instead of on the next WebDriverWait poll.
+    
+    Args:
+        driver_instance: The WebDriver instance
+        selectors: CSS selectors that must all be present
+        timeout_ms: Maximum time to wait in milliseconds
+        
+    Returns:
+        bool: True if all selectors matched before the timeout, False if it timed out,
+            or None if the wait could not run (e.g. the page navigated mid-wait)
+    """
+    expression = AWAIT_SELECTORS_JS % (json.dumps(list(selectors)), timeout_ms)
+    try:
+        response = driver_instance.execute_cdp_cmd('Runtime.evaluate', {
+            'expression': expression,
+            'awaitPromise': True,
+            'returnByValue': True
+        })
+        return bool(response.get('result', {}).get('value'))
+    except Exception as e:
+        # e.g. the page navigated and destroyed the execution context
+        logger.debug("await_selectors failed: %s", e)
+        return None
+
+
+def await_enabled_click(driver_instance, css_selector: str, timeout_ms: int) -> Optional[bool]:
+    """
+    Click an element the moment it is present and enabled, with one awaited Runtime.evaluate.
+    
+    Args:
+        driver_instance: The WebDriver instance
+        css_selector: CSS selector of the element to click
+        timeout_ms: Maximum time to wait, in milliseconds
+        
+    Returns:
+        bool: True if the element was clicked, False if it timed out, or None if the
+            evaluate did not return (e.g. the click navigated and destroyed the context)
+    """
+    expression = AWAIT_ENABLED_CLICK_JS % (json.dumps(css_selector), timeout_ms)
+    try:
+        response = driver_instance.execute_cdp_cmd('Runtime.evaluate', {
+            'expression': expression,
+            'awaitPromise': True,
+            'returnByValue': True
+        })
+        return bool(response.get('result', {}).get('value'))
+    except Exception as e:
+        # e.g. the click navigated and destroyed the execution context
+        logger.debug("await_enabled_click failed: %s", e)
+        return None
+
+
+def await_dom_quiet(driver_instance, css_selector: str, quiet_ms: int, timeout_ms: int, busy_selector: Optional[str] = None) -> bool:
+    """
+    Wait until a selector matches and the page has stopped changing, with one awaited
+    Runtime.evaluate.
+    
+    Args:
+        driver_instance: The WebDriver instance
+        css_selector: CSS selector that must match before the quiet period counts
+        quiet_ms: How long the DOM must go without mutations, in milliseconds
+        timeout_ms: Maximum time to wait, in milliseconds
+        busy_selector: Loading indicators that hold off the quiet period while visible
+        
+    Returns:
+        bool: True if the page went quiet, False if it timed out or the wait could not run
+    """
+    expression = AWAIT_DOM_QUIET_JS % (json.dumps(css_selector), json.dumps(busy_selector), quiet_ms, timeout_ms)
+    try:
+        response = driver_instance.execute_cdp_cmd('Runtime.evaluate', {
+            'expression': expression,
+            'awaitPromise': True,
+            'returnByValue': True
+        })
+        return bool(response.get('result', {}).get('value'))
+    except Exception as e:
+        logger.debug("await_dom_quiet failed: %s", e)
+        return False
+
+
+def await_text_change(driver_instance, css_selector: str, snapshot: str, timeout_ms: int) -> bool:
+    """
+    Wait until the text of the elements matching a selector differs from a snapshot,
+    with one awaited Runtime.evaluate.
+    
+    Args:
+        driver_instance: The WebDriver instance
+        css_selector: CSS selector of the elements to watch
+        snapshot: Their joined text from SELECTOR_TEXT_JS, taken before the change
+        timeout_ms: Maximum time to wait, in milliseconds
+        
+    Returns:
+        bool: True if the text changed, False if it timed out or the wait could not run
+    """
+    expression = AWAIT_TEXT_CHANGE_JS % (json.dumps(css_selector), json.dumps(snapshot), timeout_ms)
+    try:
+        response = driver_instance.execute_cdp_cmd('Runtime.evaluate', {
+            'expression': expression,
+            'awaitPromise': True,
+            'returnByValue': True
+        })
+        return bool(response.get('result', {}).get('value'))
+    except Exception as e:
+        logger.debug("await_text_change failed: %s", e)
+        return False
+
+
+def radio_locator(data_cy_text: str):
+    """
+    Build one locator matching a radio's text, label or input element.
+    
+    The three variants are joined into a CSS selector list, so a single lookup finds
+    whichever is rendered instead of timing out on each in turn.
+    
+    Args:
+        data_cy_text: The radio's text data-cy value, e.g. "radio-text-gender-0-0"
+        
+    Returns:
+        tuple: (By, selector) locator
+    """
+    suffix = data_cy_text.replace("radio-text-", "", 1)
+    return (By.CSS_SELECTOR, ', '.join([
+        f'[data-cy="{data_cy_text}"]',
+        f'label[data-cy="radio-{suffix}"]',
+        f'input[data-cy="radio-input-{suffix}"]',
+    ]))
+
+
+def dropdown_control(driver_instance, input_selector: str, timeout: float = WAIT_TIMEOUT):
+    """
+    Wait for a custom dropdown's input and return the control container around it.
+    
+    The input lookup and the ancestor walk run in one script call with native
+    Element.closest(), instead of finding the input and then walking up from it.
+    
+    Args:
+        driver_instance: The WebDriver instance
+        input_selector: CSS selector of the dropdown's search input
+        timeout: Maximum time to wait for the input in seconds
+        
+    Returns:
+        WebElement: The div.custom-dropdown__control element
+        
+    Raises:
+        TimeoutException: If the input does not appear in time
+        NoSuchElementException: If the input has no control container
+    """
+    if await_selectors(driver_instance, [input_selector], int(timeout * 1000)) is False:
+        raise TimeoutException(f"Timed out waiting for element: {input_selector}")
+    control = driver_instance.execute_script(DROPDOWN_CONTROL_JS, input_selector)
+    if control is None:
+        raise NoSuchElementException(f"No dropdown control around {input_selector}")
+    return control
+
+
+def wait_for_element(driver_instance, wait_instance, locator, condition, timeout: float = WAIT_TIMEOUT):
+    """
+    Wait for an element, getting notified by a MutationObserver instead of polling.
+    
+    CSS locators are first awaited in-page via await_selectors, so the WebDriverWait
+    that confirms the condition (clickable, present, ...) normally succeeds on its
+    first poll; it only gets the time the in-page wait left over, so the total stays
+    within timeout. Other locator types and failed in-page waits fall back to plain polling.
+    
+    Args:
+        driver_instance: The WebDriver instance
+        wait_instance: WebDriverWait instance used to confirm the condition
+        locator: (By, selector) tuple
+        condition: Expected condition factory, e.g. EC.element_to_be_clickable
+        timeout: Maximum time to wait in seconds, matching wait_instance's timeout
+        
+    Returns:
+        WebElement: The element returned by the condition
+        
+    Raises:
+        TimeoutException: If the element does not appear in time
+    """
+    if locator[0] == By.CSS_SELECTOR:
+        deadline = time.monotonic() + timeout
+        found = await_selectors(driver_instance, [locator[1]], int(timeout * 1000))
+        if found is False:
+            raise TimeoutException(f"Timed out waiting for element: {locator[1]}")
+        if found:
+            # WebDriverWait checks the condition at least once, even with no time left
+            wait_instance = WebDriverWait(driver_instance, max(deadline - time.monotonic(), 0), poll_frequency=WAIT_POLL_FREQUENCY, ignored_exceptions=WAIT_IGNORED_EXCEPTIONS)
+    return wait_instance.until(condition(locator))
+
+
+def mark_navigation(driver_instance):
+    """
+    Mark the current page before a click that should navigate away from it.
+    
+    Args:
+        driver_instance: The WebDriver instance
+    """
+    driver_instance.execute_script(MARK_NAVIGATION_JS)
+
+
+def wait_for(predicate, timeout: float = 10, base: float = WAIT_POLL_FREQUENCY, cap: float = 1.0):
+    """
+    Poll a predicate with exponential backoff until it returns a truthy value.
+    
+    The first checks are base seconds apart, so fast pages are caught quickly; the
+    interval doubles up to cap, so slow pages are not hammered with commands. Short
+    waits on sub-second UI reactions pass cap=base to keep a flat 100 ms interval.
+    
+    Args:
+        predicate: Zero-argument callable to poll
+        timeout: Maximum time to wait in seconds
+        base: Initial poll interval in seconds
+        cap: Maximum poll interval in seconds
+        
+    Returns:
+        The predicate's first truthy value, or None on timeout
+    """
+    deadline = time.monotonic() + timeout
+    interval = base
+    while True:
+        value = predicate()
+        if value:
+            return value
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, cap)
+
+
+def wait_for_navigation(driver_instance, timeout: float = WAIT_TIMEOUT):
+    """
+    Wait until the page marked by mark_navigation() has been replaced or re-routed
+    and the new document has finished loading.
+    
+    The page itself watches for the change and answers one awaited Runtime.evaluate the
+    moment it happens, so there is no polling delay. A full page load destroys the
+    awaiting context; the wait is then repeated on the new document. A reload of the
+    same URL is also detected.
+    
+    Args:
+        driver_instance: The WebDriver instance
+        timeout: Maximum time to wait in seconds
+        
+    Raises:
+        TimeoutException: If the page does not navigate in time
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutException("Timed out waiting for the page to navigate")
+        try:
+            response = driver_instance.execute_cdp_cmd('Runtime.evaluate', {
+                'expression': AWAIT_NAVIGATION_JS % int(remaining * 1000),
+                'awaitPromise': True,
+                'returnByValue': True
+            })
+            if response.get('result', {}).get('value'):
+                return
+        except WebDriverException as e:
+            # The old document unloaded mid-wait; wait again on the new one
+            logger.debug("Navigation wait interrupted: %s", e)
+        time.sleep(WAIT_POLL_FREQUENCY)
+
+
+def scroll_into_view(driver_instance, element, min_pause: float = 0.3, max_pause: float = 0.6) -> bool:
+    """
+    Scroll an element to the center of the viewport if it is not already fully visible.
+    
+    The check and the scroll run in one script call, and the follow-up human_delay is
+    only taken when the page actually moved.
+    
+    Args:
+        driver_instance: The WebDriver instance
+        element: The element to bring into view
+        min_pause: Minimum pause after scrolling, in seconds
+        max_pause: Maximum pause after scrolling, in seconds
+        
+    Returns:
+        bool: True if the element was already in view
+    """
+    already_visible = driver_instance.execute_script(SCROLL_IF_NEEDED_JS, element)
+    if not already_visible:
+        human_delay(min_pause, max_pause)
+    return already_visible
 
 
 def human_scroll(driver_instance, scroll_pause: float = 0.5):
     """
-    Perform human-like scrolling on the page.
+    Perform human-like scrolling on the page. No-op unless HUMANIZE is enabled.
     
     Args:
         driver_instance: The WebDriver instance
         scroll_pause: Pause between scrolls
     """
+    if not HUMANIZE:
+        return
     try:
         # Scroll down a bit
         driver_instance.execute_script("window.scrollBy(0, 300);")
@@ -65,47 +1132,224 @@ def human_scroll(driver_instance, scroll_pause: float = 0.5):
 
 def human_mouse_move(driver_instance, element):
     """
-    Move mouse to element in a human-like way with curved path.
+    Move mouse to element in a human-like way with curved path. No-op unless HUMANIZE is enabled.
     
     Args:
         driver_instance: The WebDriver instance
         element: The element to move to
     """
+    if not HUMANIZE:
+        return
     try:
-        # Use ActionChains with move_to_element for reliability
-        # Add some random small movements first to appear more human
-        actions = ActionChains(driver_instance)
+        # Queue every movement and pause into one W3C action sequence so the
+        # whole gesture is sent to chromedriver with a single perform()
+        actions = _get_action_chains()(driver_instance)
         
         # Sometimes add a small random movement before moving to element
         if random.random() > 0.3:
             small_offset_x = random.randint(-10, 10)
             small_offset_y = random.randint(-10, 10)
             actions.move_by_offset(small_offset_x, small_offset_y)
-            time.sleep(random.uniform(0.05, 0.15))
+            actions.pause(pregenerated_delay(0.05, 0.15))
         
         # Move to element with slight pause
         actions.move_to_element(element)
-        actions.pause(random.uniform(0.1, 0.3))
+        actions.pause(pregenerated_delay(0.1, 0.3))
         actions.perform()
         human_delay(0.2, 0.5)
     except Exception:
-        # Fallback to simple movement
+        pass
+
+
+def cdp_human_click(driver_instance, css_selector: str):
+    """
+    Scroll an element into view and click its center with trusted CDP mouse events.
+    
+    One Runtime.evaluate scrolls and measures the element, then a mouseMoved,
+    mousePressed, mouseReleased burst is sent over the DevTools connection, replacing
+    the separate scroll, ActionChains and click WebDriver round-trips.
+    
+    Args:
+        driver_instance: The WebDriver instance
+        css_selector: CSS selector of the element to click
+    """
+    expression = (
+        "(() => {"
+        f" const e = document.querySelector({json.dumps(css_selector)});"
+        " if (!e) return null;"
+        " e.scrollIntoView({block: 'center'});"
+        " const r = e.getBoundingClientRect();"
+        " return {x: r.x + r.width / 2, y: r.y + r.height / 2};"
+        " })()"
+    )
+    result = driver_instance.execute_cdp_cmd('Runtime.evaluate', {'expression': expression, 'returnByValue': True})
+    point = result.get('result', {}).get('value')
+    if not point:
+        raise TimeoutException(f"Element not found for CDP click: {css_selector}")
+    
+    for event_type in ('mouseMoved', 'mousePressed', 'mouseReleased'):
+        driver_instance.execute_cdp_cmd('Input.dispatchMouseEvent', {
+            'type': event_type,
+            'x': point['x'],
+            'y': point['y'],
+            'button': 'left' if event_type != 'mouseMoved' else 'none',
+            'clickCount': 1 if event_type != 'mouseMoved' else 0,
+        })
+
+
+def cdp_click(driver_instance, css_selector: str) -> str:
+    """
+    Find, scroll to and click an element with a single CDP Runtime.evaluate.
+    
+    Args:
+        driver_instance: The WebDriver instance
+        css_selector: CSS selector of the element to click
+        
+    Returns:
+        str: "ok" if clicked, "missing" if nothing matches, "disabled" if the match is disabled
+    """
+    expression = f"window.__rpa.click({json.dumps(css_selector)})"
+    result = driver_instance.execute_cdp_cmd('Runtime.evaluate', {'expression': expression, 'returnByValue': True})
+    return result.get('result', {}).get('value') or 'missing'
+
+
+def click_locator(driver_instance, wait_instance, locator):
+    """
+    Click the element at a CSS locator, in one CDP call if it is already on the page.
+    
+    Without HUMANIZE, cdp_click() is tried first. If the element is not there yet, is
+    disabled or HUMANIZE is on, this waits for it to be clickable and uses fast_click().
+    
+    Args:
+        driver_instance: The WebDriver instance
+        wait_instance: WebDriverWait instance for the fallback
+        locator: (By.CSS_SELECTOR, selector) tuple
+    """
+    if not HUMANIZE and cdp_click(driver_instance, locator[1]) == 'ok':
+        return
+    element = wait_for_element(driver_instance, wait_instance, locator, EC.element_to_be_clickable)
+    fast_click(driver_instance, element)
+
+
+def resilient(driver_instance, locator, action, element=None, retries: int = 3):
+    """
+    Run an action on an element, re-finding it by locator whenever it goes stale.
+    
+    Args:
+        driver_instance: The WebDriver instance
+        locator: Locator tuple used to (re-)find the element
+        action: Callable taking the element
+        element: Already-found element to try first, if any
+        retries: Maximum number of attempts
+        
+    Returns:
+        Whatever action returns
+    """
+    for attempt in range(retries):
+        if element is None:
+            element = driver_instance.find_element(*locator)
         try:
-            actions = ActionChains(driver_instance)
-            actions.move_to_element(element)
-            actions.perform()
-            human_delay(0.2, 0.5)
-        except Exception:
-            pass
+            return action(element)
+        except StaleElementReferenceException:
+            if attempt == retries - 1:
+                raise
+            logger.debug("Element %s went stale, re-finding (attempt %s)", locator[1], attempt + 1)
+            element = None
+
+
+def robust_click(driver_instance, element):
+    """
+    Click an element natively, falling back to a script click if it can't receive the click.
+    
+    Only a covered or non-interactable element triggers the fallback; any other error,
+    including a stale element, propagates to the caller.
+    
+    Args:
+        driver_instance: The WebDriver instance
+        element: The element to click
+    """
+    try:
+        element.click()
+    except (ElementClickInterceptedException, ElementNotInteractableException):
+        driver_instance.execute_script("arguments[0].click();", element)
+
+
+def fast_click(driver_instance, element):
+    """
+    Scroll an element to the center of the viewport and click it.
+    
+    Without HUMANIZE the scroll and the click run in one script call. With it the
+    element is scrolled to, hovered with human_mouse_move and clicked natively,
+    falling back to a script click if something covers it.
+    
+    Args:
+        driver_instance: The WebDriver instance
+        element: The element to click
+    """
+    if not HUMANIZE:
+        driver_instance.execute_script(FAST_CLICK_JS, element)
+        return
+    scroll_into_view(driver_instance, element, 0.3, 0.6)
+    human_mouse_move(driver_instance, element)
+    robust_click(driver_instance, element)
+
+
+def js_set_value(driver_instance, element, value: str):
+    """
+    Set an input's value in one script call, firing the events React listens for.
+    
+    Args:
+        driver_instance: The WebDriver instance
+        element: The input element
+        value: Value to set
+    """
+    driver_instance.execute_script(SET_INPUT_VALUE_JS, element, value)
+
+
+def fast_type(driver_instance, element, text: str):
+    """
+    Focus an input and insert text with a single CDP Input.insertText call.
+    
+    The browser fires input events as it would for typed text, so listeners that
+    drive autocomplete still run. Falls back to send_keys if the CDP call fails.
+    
+    Args:
+        driver_instance: The WebDriver instance
+        element: The input to type into
+        text: Text to insert
+    """
+    driver_instance.execute_script("arguments[0].focus();", element)
+    try:
+        driver_instance.execute_cdp_cmd('Input.insertText', {'text': text})
+    except WebDriverException as e:
+        logger.debug("Input.insertText failed, typing with send_keys: %s", e)
+        element.send_keys(text)
+
+
+def cdp_press_enter(driver_instance):
+    """
+    Press Enter on the focused element with CDP Input.dispatchKeyEvent.
+    
+    The browser delivers keydown, keypress and keyup as trusted events, with no
+    WebDriver actions round-trip.
+    
+    Args:
+        driver_instance: The WebDriver instance
+    """
+    key = {'key': 'Enter', 'code': 'Enter', 'windowsVirtualKeyCode': 13, 'nativeVirtualKeyCode': 13}
+    driver_instance.execute_cdp_cmd('Input.dispatchKeyEvent', dict(key, type='keyDown', text='\r'))
+    driver_instance.execute_cdp_cmd('Input.dispatchKeyEvent', dict(key, type='keyUp'))
 
 
 def random_page_interaction(driver_instance):
     """
-    Perform random human-like page interactions to appear more natural.
+    Perform random human-like page interactions to appear more natural. No-op unless HUMANIZE is enabled.
     
     Args:
         driver_instance: The WebDriver instance
     """
+    if not HUMANIZE:
+        return
     try:
         # Random scroll
         scroll_amount = random.randint(100, 400)
@@ -136,87 +1380,490 @@ def select_custom_dropdown(driver_instance, wait_instance, data_cy_value, value_
         bool: True if successful, False otherwise
     """
     try:
-        logger.info(f"Selecting {field_name}: {value_to_select}")
+        logger.info("Selecting %s: %s", field_name, value_to_select)
         
-        # Find the dropdown input first
-        dropdown_input = wait_instance.until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, f'[data-cy="{data_cy_value}"]'))
-        )
-        
-        # Find the parent control container to click on
-        try:
-            # Get the parent control container
-            control_container = dropdown_input.find_element(By.XPATH, "./ancestor::div[contains(@class, 'custom-dropdown__control')]")
-        except Exception:
-            # Fallback: try to find control by searching from input
-            control_container = driver_instance.find_element(By.XPATH, f"//input[@data-cy='{data_cy_value}']/ancestor::div[contains(@class, 'custom-dropdown__control')]")
+        # Find the control container around the dropdown input to click on
+        control_container = dropdown_control(driver_instance, f'[data-cy="{data_cy_value}"]')
         
         # Scroll to dropdown control
-        driver_instance.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", control_container)
-        human_delay(0.3, 0.6)
+        scroll_into_view(driver_instance, control_container, 0.3, 0.6)
         human_mouse_move(driver_instance, control_container)
         human_delay(0.2, 0.4)
         
         # Click on the control container to open dropdown (not the input directly)
+        robust_click(driver_instance, control_container)
+        
+        # Wait for the menu to render rather than a fixed pause
+        if not wait_for(lambda: driver_instance.find_elements(By.CSS_SELECTOR, '.custom-dropdown__menu'), timeout=1.5, cap=WAIT_POLL_FREQUENCY):
+            logger.debug("%s menu did not render after opening, typing anyway", field_name)
+        
+        # Set the search value and press Enter with in-page scripts that look the input up
+        # and act on it atomically, so a React re-render cannot leave a stale reference
+        selector = f'[data-cy="{data_cy_value}"]'
+        wait_for_element(driver_instance, wait_instance, (By.CSS_SELECTOR, selector), EC.element_to_be_clickable)
+        human_delay(0.2, 0.4)
+        
+        if not driver_instance.execute_script(SET_INPUT_VALUE_JS, selector, str(value_to_select)):
+            logger.error("Failed to select %s '%s': input disappeared before typing", field_name, value_to_select)
+            return False
+        
+        # Click the filtered option as soon as it renders instead of sleeping for the filter
+        if wait_for(lambda: driver_instance.execute_script(CLICK_MATCHING_OPTION_JS, str(value_to_select)), timeout=3, cap=WAIT_POLL_FREQUENCY):
+            logger.info("%s '%s' selected successfully", field_name, value_to_select)
+            human_delay(0.5, 1.0)
+            return True
+        
+        # No option matched the text, press Enter to auto-select the first option
+        if not driver_instance.execute_script(FOCUS_ELEMENT_JS, selector):
+            logger.error("Failed to select %s '%s': input disappeared before Enter", field_name, value_to_select)
+            return False
+        cdp_press_enter(driver_instance)
+        logger.info("%s '%s' selected successfully using Enter key", field_name, value_to_select)
+        human_delay(0.5, 1.0)
+        return True
+        
+    except Exception as e:
+        logger.error("Error selecting %s: %s", field_name, e)
+        return False
+
+
+def select_dropdown_option(driver_instance, wait_instance, data_cy_value, value_to_select, field_name):
+    """
+    Select a dropdown value with one in-page script, falling back to select_custom_dropdown.
+    
+    The script opens the menu and clicks the option whose text matches the value, so
+    a known option is picked in a single round-trip instead of a type-filter-Enter
+    sequence.
+    
+    Args:
+        driver_instance: The WebDriver instance
+        wait_instance: WebDriverWait instance, used by the fallback
+        data_cy_value: The data-cy attribute value of the dropdown input
+        value_to_select: The value to select from the dropdown
+        field_name: Name of the field for logging
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        if driver_instance.execute_script(
+            SELECT_DROPDOWN_OPTION_JS, f'[data-cy="{data_cy_value}"]', str(value_to_select), 5000
+        ):
+            logger.info("%s '%s' selected in-page", field_name, value_to_select)
+            human_delay(0.5, 1.0)
+            return True
+        logger.info("%s option '%s' not found in-page, typing it instead", field_name, value_to_select)
+    except Exception as e:
+        logger.warning("In-page %s selection failed: %s", field_name, e)
+    return select_custom_dropdown(driver_instance, wait_instance, data_cy_value, value_to_select, field_name)
+
+
+def click_save_and_continue(driver_instance, wait_instance) -> str:
+    """
+    Click the "Save & continue" button once it is enabled and wait for the next page.
+    
+    Args:
+        driver_instance: The WebDriver instance
+        wait_instance: WebDriverWait instance
+        
+    Returns:
+        str: URL of the page the click navigated to
+    """
+    # Mark the current page so the navigation the click triggers can be detected in-page
+    mark_navigation(driver_instance)
+    
+    # Click the button in-page as soon as it is enabled; the page notifies the wait
+    # through a MutationObserver on its "disabled" attribute
+    clicked = False if HUMANIZE else await_enabled_click(driver_instance, CONTINUE_BUTTON[1], WAIT_TIMEOUT * 1000)
+    if clicked is None:
+        # The evaluate was cut short, usually by the navigation the click started; ask the
+        # page whether it clicked so the button is never pressed twice
         try:
-            control_container.click()
-        except Exception:
-            # If click fails, use JavaScript click
-            driver_instance.execute_script("arguments[0].click();", control_container)
+            clicked = driver_instance.execute_script(ENABLED_CLICK_DONE_JS)
+        except WebDriverException:
+            # The page is still being replaced, so the click went through
+            clicked = True
+    if not clicked:
+        # Wait once for the button to be clickable (present, visible and enabled)
+        save_button = wait_for_element(driver_instance, wait_instance, CONTINUE_BUTTON, EC.element_to_be_clickable)
+        logger.info("Save & continue button found and enabled")
         
-        human_delay(0.5, 1.0)  # Wait for dropdown to open
+        # Human-like behavior: scroll to button and move mouse
+        scroll_into_view(driver_instance, save_button, 0.5, 1.0)
+        human_mouse_move(driver_instance, save_button)
+        human_delay(0.4, 0.8)
+        robust_click(driver_instance, save_button)
+    logger.info("Save & continue button clicked, waiting for new page to load")
+    wait_for_navigation(driver_instance)
+    return driver_instance.current_url
+
+
+def run_form_actions(driver_instance, wait_instance, actions):
+    """
+    Fill a page from a table of actions such as STEP10_ACTIONS.
+    
+    The selected state of every "radio_if_unset" radio is read with one script call
+    when the first of them is reached.
+    
+    Args:
+        driver_instance: The WebDriver instance
+        wait_instance: WebDriverWait instance
+        actions: List of (kind, target, value, label) tuples
         
-        # Now find and interact with the input field
-        dropdown_input = wait_instance.until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, f'[data-cy="{data_cy_value}"]'))
-        )
+    Raises:
+        Exception: If a "radio", "click" or "text" action fails
+    """
+    radio_states = None
+    for kind, target, value, label in actions:
+        logger.info("Filling %s", label)
+        if kind == "radio":
+            click_locator(driver_instance, wait_instance, radio_locator(target))
+            human_delay(0.3, 0.5)
+        elif kind == "radio_if_unset":
+            try:
+                if radio_states is None:
+                    radio_states = driver_instance.execute_script(
+                        RADIO_SELECTED_STATES_JS, [t for k, t, _, _ in actions if k == "radio_if_unset"]
+                    )
+                selected = radio_states.get(target)
+                if selected is None:
+                    # Not rendered when the states were read; wait for it and read it again
+                    await_selectors(driver_instance, [f'[data-cy="{target}"]'], QUICK_WAIT_TIMEOUT * 1000)
+                    selected = driver_instance.execute_script(RADIO_SELECTED_STATES_JS, [target]).get(target)
+                    if selected is None:
+                        raise NoSuchElementException(f"Radio not found: {target}")
+                if selected:
+                    logger.info("%s already selected, skipping", label)
+                    continue
+                click_locator(driver_instance, wait_instance, radio_locator(target))
+                human_delay(0.3, 0.5)
+            except Exception as e:
+                logger.warning("Could not check/select %s: %s", label, e)
+                continue
+        elif kind == "click":
+            click_locator(driver_instance, wait_instance, target)
+            human_delay(0.3, 0.5)
+        elif kind == "text":
+            field_input = wait_for_element(driver_instance, wait_instance, target, EC.presence_of_element_located)
+            scroll_into_view(driver_instance, field_input, 0.3, 0.6)
+            human_mouse_move(driver_instance, field_input)
+            js_set_value(driver_instance, field_input, value)
+            human_delay(0.5, 1.0)
+        elif kind == "dropdown":
+            if not select_custom_dropdown(driver_instance, wait_instance, target, value, label):
+                logger.warning("Could not select %s, continuing...", label)
+                continue
+        else:
+            raise ValueError(f"Unknown form action: {kind}")
+        logger.info("%s filled successfully", label)
+
+
+def find_chrome_binary() -> Optional[str]:
+    """
+    Locate the Chrome/Chromium binary in Docker/headless environments.
+    
+    Returns:
+        str: Path to the binary, or None to let undetected-chromedriver auto-detect it
+    """
+    for path in ("/usr/bin/google-chrome", "/usr/bin/google-chrome-stable", "/usr/bin/chromium", "/usr/bin/chromium-browser"):
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def create_driver(headless: bool, cache_dir: Optional[str] = None) -> "uc.Chrome":
+    """
+    Launch an undetected Chrome driver with stealth options and scripts applied.
+    
+    Args:
+        headless: Whether to run Chrome in headless mode
+        cache_dir: Persistent HTTP cache directory, or None for the profile's own cache
         
-        # Clear and type the value to search
+    Returns:
+        uc.Chrome: The initialized driver
+    """
+    # Initialize undetected Chrome driver (specifically designed to bypass bot detection)
+    logger.info("Initializing undetected Chrome driver for maximum stealth")
+    
+    uc = _get_uc()
+    
+    # Configure options for undetected-chromedriver
+    options = uc.ChromeOptions()
+    
+    if headless:
+        options.add_argument("--headless=new")  # Use new headless mode
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-software-rasterizer")
+        options.add_argument("--disable-extensions")
+        logger.info("Headless mode enabled")
+    
+    # Additional stealth options
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("--window-size=1920,1080")
+    # Set at launch so no per-session Network.setUserAgentOverride call is needed
+    options.add_argument(f"--user-agent={USER_AGENT}")
+    options.add_argument("--start-maximized")
+    options.add_argument("--disable-infobars")
+    options.add_argument("--disable-web-security")
+    options.add_argument("--disable-features=IsolateOrigins,site-per-process")
+    options.add_argument("--disable-site-isolation-trials")
+    options.add_argument("--disable-background-timer-throttling")
+    options.add_argument("--disable-backgrounding-occluded-windows")
+    options.add_argument("--disable-renderer-backgrounding")
+    options.add_argument("--disable-features=TranslateUI")
+    options.add_argument("--disable-ipc-flooding-protection")
+    
+    # Only the HTTP cache persists; the profile itself (cookies, storage) stays a
+    # throwaway one so runs never inherit session state
+    if cache_dir:
+        options.add_argument(f"--disk-cache-dir={cache_dir}")
+    
+    # Additional preferences
+    prefs = {
+        "credentials_enable_service": False,
+        "profile.password_manager_enabled": False,
+        "profile.default_content_setting_values.notifications": 2
+    }
+    if BLOCK_RESOURCES:
+        # BLOCKED_URL_PATTERNS only matches images by extension; the content setting
+        # also stops extensionless CDN and CSS background images. Stylesheets stay on,
+        # since visibility and clickability checks depend on layout.
+        prefs["profile.managed_default_content_settings.images"] = 2
+        options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_experimental_option("prefs", prefs)
+    
+    chrome_binary_path = find_chrome_binary()
+    if chrome_binary_path:
+        options.binary_location = chrome_binary_path
+        logger.info("Using Chrome binary at: %s", chrome_binary_path)
+    
+    # version_main can be set to match your Chrome version, or leave None for auto-detection
+    new_driver = uc.Chrome(
+        options=options,
+        version_main=144,  # Force ChromeDriver version 144 to match Chrome browser
+        use_subprocess=True,  # Use subprocess for better isolation
+        driver_executable_path=None  # Auto-download chromedriver
+    )
+    logger.info("Undetected Chrome driver initialized successfully")
+    
+    # WebDriverWait and the in-page MutationObserver waits are the only waiting
+    # primitives. An implicit wait would make every find inside them block on absent
+    # elements, so a probe for an optional widget would pay it on each poll.
+    new_driver.implicitly_wait(0)
+    
+    # Every WebDriver and CDP command goes through execute(); pay off deferred
+    # human_delay pauses there
+    execute_command = new_driver.execute
+    
+    def execute_after_delay(driver_command, params=None):
+        delay_budget.settle()
+        return execute_command(driver_command, params)
+    
+    new_driver.execute = execute_after_delay
+    
+    apply_page_overrides(new_driver, headless)
+    
+    return new_driver
+
+
+def apply_page_overrides(driver_instance, headless: bool):
+    """
+    Register stealth and controller scripts, device metrics, cache settings and URL
+    blocking on the driver's current tab.
+    
+    All are per-tab CDP state, so they must be re-applied to every new tab.
+    
+    Args:
+        driver_instance: The WebDriver instance
+        headless: Whether Chrome is running in headless mode
+    """
+    # Stealth scripts are registered once per tab and apply to every later navigation
+    logger.info("Applying additional stealth techniques")
+    driver_instance.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+        'source': STEALTH_JS if headless else HEADED_STEALTH_JS
+    })
+    # Registered separately so an exception in a stealth override cannot abort it
+    driver_instance.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+        'source': RPA_CONTROLLER_JS
+    })
+    
+    # Set device metrics to appear as a real window
+    if headless:
+        driver_instance.execute_cdp_cmd('Emulation.setDeviceMetricsOverride', {
+            "width": 1920,
+            "height": 1080,
+            "deviceScaleFactor": 1,
+            "mobile": False
+        })
+    
+    # Keep the HTTP cache on so static assets loaded by earlier steps and earlier runs
+    # in this browser are served locally on later page loads
+    driver_instance.execute_cdp_cmd('Network.enable', {})
+    driver_instance.execute_cdp_cmd('Network.setCacheDisabled', {'cacheDisabled': False})
+    
+    # Requests for blocked assets fail in the browser without touching the network
+    if BLOCK_RESOURCES:
+        driver_instance.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+
+
+def reset_driver(driver_instance, headless: bool):
+    """
+    Swap in a fresh tab, clear session state and preload the start page so a pooled
+    browser can start the next quote from scratch without relaunching Chrome.
+    
+    Args:
+        driver_instance: The WebDriver instance
+        headless: Whether Chrome is running in headless mode
+    """
+    # A new tab drops the previous run's JS heap, timers and listeners; opening
+    # one costs a fraction of a process launch
+    old_handle = driver_instance.current_window_handle
+    driver_instance.switch_to.new_window('tab')
+    new_handle = driver_instance.current_window_handle
+    driver_instance.switch_to.window(old_handle)
+    driver_instance.close()
+    driver_instance.switch_to.window(new_handle)
+    apply_page_overrides(driver_instance, headless)
+    
+    driver_instance.execute_cdp_cmd('Network.clearBrowserCookies', {})
+    driver_instance.execute_cdp_cmd('Storage.clearDataForOrigin', {
+        'origin': SITE_ORIGIN,
+        'storageTypes': 'all'
+    })
+    
+    # Load the start page now, while the browser sits idle, so the next run can skip
+    # the navigation if it starts within START_PAGE_TTL
+    driver_instance.get(START_URL)
+    driver_instance.execute_script(MARK_PRELOADED_JS)
+
+
+class DriverPool:
+    """
+    Pool of warm Chrome sessions reused across /start runs.
+    
+    Launching Chrome (process start, profile init, stealth injection) dominates
+    per-run latency, so browsers are reset and returned here instead of quit.
+    """
+    
+    def __init__(self, size: int, headless: bool, max_uses: int):
+        self.size = size
+        self.headless = headless
+        self.max_uses = max_uses
+        self._idle = queue.Queue(maxsize=size)
+        self._lock = threading.Lock()
+        self._created = 0
+        self._uses: dict = {}
+        # Cache slots not held by a live browser, and the slot each browser holds
+        self._free_slots = list(range(size))
+        self._slots: dict = {}
+    
+    def _reserve(self) -> bool:
+        """Claim a slot for a new browser if the pool is not full."""
+        with self._lock:
+            if self._created >= self.size:
+                return False
+            self._created += 1
+            return True
+    
+    def _launch(self) -> "uc.Chrome":
+        """Launch a browser for a reserved slot, freeing the slot on failure."""
+        with self._lock:
+            slot = self._free_slots.pop()
+        cache_dir = os.path.join(BROWSER_CACHE_DIR, f"slot-{slot}") if BROWSER_CACHE_DIR else None
+        try:
+            driver_instance = create_driver(self.headless, cache_dir)
+        except Exception:
+            with self._lock:
+                self._created -= 1
+                self._free_slots.append(slot)
+            raise
+        with self._lock:
+            self._slots[id(driver_instance)] = slot
+        return driver_instance
+    
+    def _discard(self, driver_instance):
+        """Quit a browser and free its slot."""
         try:
-            dropdown_input.clear()
+            driver_instance.quit()
         except Exception:
-            # If clear fails, select all and delete
-            dropdown_input.send_keys(Keys.CONTROL + "a")
-            dropdown_input.send_keys(Keys.DELETE)
-        
-        human_delay(0.2, 0.4)
+            pass
+        with self._lock:
+            self._created -= 1
+            self._uses.pop(id(driver_instance), None)
+            self._free_slots.append(self._slots.pop(id(driver_instance)))
+    
+    def warm(self):
+        """Launch browsers until the pool is full. Failures are logged, not raised."""
+        while self._reserve():
+            try:
+                self._idle.put(self._launch())
+            except Exception as e:
+                logger.warning("Could not pre-warm browser: %s", e)
+                return
+    
+    def acquire(self) -> "uc.Chrome":
+        """
+        Check out a live browser, launching one if the pool has free slots.
         
-        # Type the value character by character
-        for char in str(value_to_select):
+        Returns:
+            uc.Chrome: A browser ready to navigate
+        """
+        while True:
             try:
-                dropdown_input.send_keys(char)
-            except StaleElementReferenceException:
-                # Re-find input if stale
-                dropdown_input = driver_instance.find_element(By.CSS_SELECTOR, f'[data-cy="{data_cy_value}"]')
-                dropdown_input.send_keys(char)
-            time.sleep(random.uniform(0.05, 0.12))
+                driver_instance = self._idle.get_nowait()
+            except queue.Empty:
+                if self._reserve():
+                    return self._launch()
+                try:
+                    driver_instance = self._idle.get(timeout=1)
+                except queue.Empty:
+                    continue
+            
+            # Browsers can die while idle; drop them and try again
+            try:
+                driver_instance.current_url
+                return driver_instance
+            except Exception:
+                logger.warning("Discarding dead pooled browser")
+                self._discard(driver_instance)
+    
+    def release(self, driver_instance):
+        """
+        Reset a browser and return it to the pool, or discard it if the reset fails.
         
-        human_delay(0.8, 1.5)  # Wait for dropdown options to appear and filter
+        Args:
+            driver_instance: The browser returned by acquire()
+        """
+        with self._lock:
+            uses = self._uses.get(id(driver_instance), 0) + 1
+            self._uses[id(driver_instance)] = uses
+        if uses >= self.max_uses:
+            logger.info("Recycling browser after %s runs", uses)
+            self._discard(driver_instance)
+            return
         
-        # Press Enter to auto-select the first option
         try:
-            dropdown_input.send_keys(Keys.RETURN)
-            logger.info(f"{field_name} '{value_to_select}' selected successfully using Enter key")
-            human_delay(0.5, 1.0)
-            return True
-        except StaleElementReferenceException:
-            # Re-find input if stale and try again
-            try:
-                dropdown_input = driver_instance.find_element(By.CSS_SELECTOR, f'[data-cy="{data_cy_value}"]')
-                dropdown_input.send_keys(Keys.RETURN)
-                logger.info(f"{field_name} '{value_to_select}' selected successfully using Enter key")
-                human_delay(0.5, 1.0)
-                return True
-            except Exception as e:
-                logger.error(f"Failed to select {field_name} '{value_to_select}': {str(e)}")
-                return False
+            reset_driver(driver_instance, self.headless)
         except Exception as e:
-            logger.error(f"Failed to select {field_name} '{value_to_select}': {str(e)}")
-            return False
-        
-    except Exception as e:
-        logger.error(f"Error selecting {field_name}: {str(e)}")
-        return False
+            logger.warning("Discarding browser that could not be reset: %s", e)
+            self._discard(driver_instance)
+            return
+        self._idle.put(driver_instance)
+    
+    def close(self):
+        """Quit every idle browser."""
+        while True:
+            try:
+                driver_instance = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._discard(driver_instance)
+
+
+# Warm browsers reused across /start runs
+driver_pool = DriverPool(DRIVER_POOL_SIZE, HEADLESS, DRIVER_MAX_USES)
 
 
 class StartRequest(BaseModel):
@@ -231,247 +1878,145 @@ async def start_bot(request: StartRequest):
     """
     Start the Selenium bot and open The Zebra insurance website.
     
+    The blocking Selenium flow runs in a worker thread so the event loop keeps
+    serving other endpoints (e.g. /status) while a bot run is in progress.
+    Up to DRIVER_POOL_SIZE runs proceed in parallel, each on its own pooled browser;
+    further requests wait for a free worker.
+    
     Args:
         request: StartRequest containing vehicle details
         
     Returns:
         dict: Status message and browser info
     """
-    global driver
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(bot_executor, _start_bot_sync, request)
+
+
+@app.post("/start/stream")
+async def start_bot_stream(request: StartRequest):
+    """
+    Run the same flow as /start, streaming each plan's quotes as soon as they are scraped.
     
-    # Hardcoded headless setting
-    headless = True
+    The response is NDJSON: one {"plan": ..., "quotes": [...]} line per plan as steps
+    12-14 finish, then a final line holding the same body /start would have returned.
     
-
-    try:
-        logger.info(f"Starting bot with headless={headless}")
+    Args:
+        request: StartRequest containing vehicle details
         
-        # Close existing browser if any
-        if driver is not None:
-            logger.info("Closing existing browser instance")
-            try:
-                driver.quit()
-            except Exception:
-                pass
+    Returns:
+        StreamingResponse: application/x-ndjson stream
+    """
+    loop = asyncio.get_running_loop()
+    lines: asyncio.Queue = asyncio.Queue()
+    
+    def on_plan(plan_type, quotes):
+        # Called on the bot thread; hand the line over to the event loop
+        loop.call_soon_threadsafe(lines.put_nowait, json.dumps({"plan": plan_type, "quotes": quotes}) + "\n")
+    
+    future = loop.run_in_executor(bot_executor, _start_bot_sync, request, on_plan)
+    # Runs on the loop after every on_plan line already queued, so it marks the end
+    future.add_done_callback(lambda _: lines.put_nowait(None))
+    
+    async def generate():
+        while (line := await lines.get()) is not None:
+            yield line
+        yield json.dumps(future.result()) + "\n"
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+def _start_bot_sync(request: StartRequest, on_plan: Optional[Callable[[str, list], None]] = None) -> dict:
+    """
+    Check a browser out of the pool, run the quote flow on it and hand it back.
+    
+    Args:
+        request: StartRequest containing vehicle details
+        on_plan: Called with (plan_type, quotes) as each plan's quotes are scraped
         
-        # Initialize undetected Chrome driver (specifically designed to bypass bot detection)
-        logger.info("Initializing undetected Chrome driver for maximum stealth")
+    Returns:
+        dict: Scraped quotes, or an error payload
+    """
+    logger.info("Starting bot with headless=%s", HEADLESS)
+    try:
+        driver = driver_pool.acquire()
+    except Exception as e:
+        logger.error("Failed to initialize undetected Chrome driver: %s", e)
+        return {
+            "status": "error",
+            "message": f"Failed to initialize Chrome driver: {str(e)}",
+            "error_type": type(e).__name__,
+            "suggestion": "Make sure Google Chrome is installed. undetected-chromedriver will auto-download the matching ChromeDriver."
+        }
+    
+    with active_drivers_lock:
+        active_drivers.append(driver)
+    try:
+        return _run_quote_flow(driver, request, on_plan)
+    finally:
+        with active_drivers_lock:
+            active_drivers.remove(driver)
+        # Reset and return the browser to the pool instead of quitting it, off the
+        # request path so the caller gets its quotes without waiting for the reset
         try:
-            # Configure options for undetected-chromedriver
-            options = uc.ChromeOptions()
-            
-            if headless:
-                options.add_argument("--headless=new")  # Use new headless mode
-                options.add_argument("--disable-gpu")
-                options.add_argument("--disable-software-rasterizer")
-                options.add_argument("--disable-extensions")
-                logger.info("Headless mode enabled")
-            
-            # Additional stealth options
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-blink-features=AutomationControlled")
-            options.add_argument("--window-size=1920,1080")
-            options.add_argument("--start-maximized")
-            options.add_argument("--disable-infobars")
-            options.add_argument("--disable-web-security")
-            options.add_argument("--disable-features=IsolateOrigins,site-per-process")
-            options.add_argument("--disable-site-isolation-trials")
-            options.add_argument("--disable-background-timer-throttling")
-            options.add_argument("--disable-backgrounding-occluded-windows")
-            options.add_argument("--disable-renderer-backgrounding")
-            options.add_argument("--disable-features=TranslateUI")
-            options.add_argument("--disable-ipc-flooding-protection")
-            
-            # Additional preferences
-            prefs = {
-                "credentials_enable_service": False,
-                "profile.password_manager_enabled": False,
-                "profile.default_content_setting_values.notifications": 2
-                
-            }
-            options.add_experimental_option("prefs", prefs)
-            
-            # Initialize undetected Chrome driver
-            # version_main can be set to match your Chrome version, or leave None for auto-detection
-            # In Docker/headless environments, specify Chrome binary path
-            import os
-            chrome_binary_path = None
-            if os.path.exists("/usr/bin/google-chrome"):
-                chrome_binary_path = "/usr/bin/google-chrome"
-            elif os.path.exists("/usr/bin/google-chrome-stable"):
-                chrome_binary_path = "/usr/bin/google-chrome-stable"
-            elif os.path.exists("/usr/bin/chromium"):
-                chrome_binary_path = "/usr/bin/chromium"
-            elif os.path.exists("/usr/bin/chromium-browser"):
-                chrome_binary_path = "/usr/bin/chromium-browser"
-            
-            if chrome_binary_path:
-                options.binary_location = chrome_binary_path
-                logger.info(f"Using Chrome binary at: {chrome_binary_path}")
-            
-            driver = uc.Chrome(
-                options=options,
-                version_main=144,  # Force ChromeDriver version 144 to match Chrome browser
-                use_subprocess=True,  # Use subprocess for better isolation
-                driver_executable_path=None  # Auto-download chromedriver
-            )
-            logger.info("Undetected Chrome driver initialized successfully")
-            
-        except Exception as e:
-            logger.error(f"Failed to initialize undetected Chrome driver: {str(e)}")
-            return {
-                "status": "error",
-                "message": f"Failed to initialize Chrome driver: {str(e)}",
-                "error_type": type(e).__name__,
-                "suggestion": "Make sure Google Chrome is installed. undetected-chromedriver will auto-download the matching ChromeDriver."
-            }
-        
-        # Additional stealth scripts for extra protection
-        logger.info("Applying additional stealth techniques")
-        
-        # Enhanced anti-detection for headless mode
-        if headless:
-            # Override navigator.webdriver property
-            driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
-                'source': '''
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => undefined
-                    });
-                '''
-            })
-            
-            # Override Chrome runtime
-            driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
-                'source': '''
-                    window.navigator.chrome = {
-                        runtime: {},
-                        loadTimes: function() {},
-                        csi: function() {},
-                        app: {}
-                    };
-                '''
-            })
-            
-            # Override permissions
-            driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
-                'source': '''
-                    const originalQuery = window.navigator.permissions.query;
-                    window.navigator.permissions.query = (parameters) => (
-                        parameters.name === 'notifications' ?
-                            Promise.resolve({ state: Notification.permission }) :
-                            originalQuery(parameters)
-                    );
-                '''
-            })
-        
-        # Enhanced fingerprinting protection
-        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
-            'source': '''
-                // Remove webdriver property
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-                
-                // Additional fingerprinting protection
-                Object.defineProperty(navigator, 'hardwareConcurrency', {
-                    get: () => 8
-                });
-                Object.defineProperty(navigator, 'deviceMemory', {
-                    get: () => 8
-                });
-                
-                // Override plugins
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5]
-                });
-                
-                // Override languages
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['en-US', 'en']
-                });
-                
-                // Canvas fingerprinting protection
-                const originalToDataURL = HTMLCanvasElement.prototype.toDataURL;
-                HTMLCanvasElement.prototype.toDataURL = function(type) {
-                    const context = this.getContext('2d');
-                    if (context) {
-                        const imageData = context.getImageData(0, 0, this.width, this.height);
-                        for (let i = 0; i < imageData.data.length; i += 4) {
-                            imageData.data[i] += Math.floor(Math.random() * 3) - 1;
-                        }
-                        context.putImageData(imageData, 0, 0);
-                    }
-                    return originalToDataURL.apply(this, arguments);
-                };
-                
-                // WebGL fingerprinting protection
-                const getParameter = WebGLRenderingContext.prototype.getParameter;
-                WebGLRenderingContext.prototype.getParameter = function(parameter) {
-                    if (parameter === 37445) {
-                        return 'Intel Inc.';
-                    }
-                    if (parameter === 37446) {
-                        return 'Intel Iris OpenGL Engine';
-                    }
-                    return getParameter.apply(this, arguments);
-                };
-                
-                // Override headless detection
-                Object.defineProperty(navigator, 'maxTouchPoints', {
-                    get: () => 0
-                });
-            '''
-        })
-        
-        # Set user agent override
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        })
+            reset_executor.submit(driver_pool.release, driver)
+        except RuntimeError:
+            # The executor is shut down, so the app is stopping
+            driver_pool.release(driver)
+
+
+def _run_quote_flow(driver, request: StartRequest, on_plan: Optional[Callable[[str, list], None]] = None) -> dict:
+    """
+    Run the full quote flow synchronously on the checked-out browser.
+    
+    Args:
+        driver: The browser checked out of the pool for this run
+        request: StartRequest containing vehicle details
+        on_plan: Called with (plan_type, quotes) as each plan's quotes are scraped
         
-        # Set device metrics to appear as a real window
-        if headless:
-            driver.execute_cdp_cmd('Emulation.setDeviceMetricsOverride', {
-                "width": 1920,
-                "height": 1080,
-                "deviceScaleFactor": 1,
-                "mobile": False
-            })
+    Returns:
+        dict: Scraped quotes, or an error payload
+    """
+    headless = HEADLESS
+    
+    # Pauses deferred at the end of an earlier run on this worker thread aren't owed here
+    delay_budget.reset()
+    
+    try:
+        # Build the waits once per driver session. WebDriverWait polls client-side,
+        # so a shorter poll interval detects elements sooner at no extra cost.
+        wait = WebDriverWait(driver, WAIT_TIMEOUT, poll_frequency=WAIT_POLL_FREQUENCY, ignored_exceptions=WAIT_IGNORED_EXCEPTIONS)
+        button_wait = WebDriverWait(driver, 60 if headless else WAIT_TIMEOUT, poll_frequency=WAIT_POLL_FREQUENCY, ignored_exceptions=WAIT_IGNORED_EXCEPTIONS)
+        quick_wait = WebDriverWait(driver, QUICK_WAIT_TIMEOUT, poll_frequency=WAIT_POLL_FREQUENCY, ignored_exceptions=WAIT_IGNORED_EXCEPTIONS)
         
-        # Navigate to the website AFTER stealth scripts are set up
-        url = "https://www.thezebra.com/insurance/car/prefill/start/"
-        logger.info(f"Navigating to URL: {url}")
-        driver.get(url)
-        logger.info("Page navigation initiated")
+        # Navigate to the website AFTER stealth scripts are set up. Browsers returned
+        # to the pool are parked on the start page by reset_driver; reuse it while fresh.
+        preload_age = driver.execute_script(PRELOAD_AGE_JS, START_URL)
+        if preload_age is not None and preload_age < START_PAGE_TTL:
+            logger.info("Start page preloaded %.0fs ago by the pool, skipping navigation", preload_age)
+        else:
+            logger.info("Navigating to URL: %s", START_URL)
+            driver.get(START_URL)
+            logger.info("Page navigation initiated")
         
         # Wait for page to load
         logger.info("Waiting for page to load")
-        wait = WebDriverWait(driver, 30)
         
         # Wait for the page to be fully loaded
         wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
         logger.info("Page body loaded")
         
-        # In headless mode, wait longer for dynamic content to load
+        # Wait for the page to be interactive: one predicate covers readyState and
+        # React having mounted interactive elements, evaluated once per poll
+        try:
+            wait.until(lambda d: d.execute_script(PAGE_READY_JS))
+            logger.info("Page is interactive (readyState = complete, interactive elements detected)")
+        except Exception:
+            logger.warning("Could not verify page readiness, continuing anyway")
+        
+        # PAGE_READY_JS has already gated on readiness, and the compare button below is
+        # polled until it renders, so no fixed settle is needed here
         if headless:
-            logger.info("Headless mode detected - waiting longer for dynamic content")
-            # Wait for page to be fully interactive
-            try:
-                wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
-                logger.info("Page readyState = complete")
-            except Exception:
-                logger.warning("Could not verify readyState")
-            
-            # Wait for React/JS to initialize
-            try:
-                wait.until(lambda d: d.execute_script("return typeof window !== 'undefined' && typeof document !== 'undefined'"))
-                logger.info("Window and document objects available")
-            except Exception:
-                pass
-            
-            # Wait for any loading indicators to disappear
-            human_delay(5.0, 8.0)  # Longer wait in headless mode for JS to execute
-            
             # Simulate some page interaction even in headless
             try:
                 driver.execute_script("window.scrollTo(0, 100);")
@@ -488,139 +2033,16 @@ async def start_bot(request: StartRequest):
             human_scroll(driver)
             human_delay(0.5, 1.0)
         
-        logger.info("Additional wait completed for dynamic content")
-        
         # Find and click the "I want to compare my current insurance" button
         logger.info("Looking for 'I want to compare my current insurance' button")
         
-        # Wait for the page to be interactive before looking for buttons
-        try:
-            wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
-            logger.info("Page is fully loaded (readyState = complete)")
-        except Exception:
-            logger.warning("Could not verify page readyState, continuing anyway")
-        
-        # Wait for React components to be mounted
-        try:
-            # Wait for common React indicators
-            wait.until(lambda d: d.execute_script("""
-                return document.querySelectorAll('[data-cy], [class*="radio"], button, input').length > 0;
-            """))
-            logger.info("Interactive elements detected on page")
-        except Exception:
-            logger.warning("Could not detect interactive elements, continuing anyway")
-        
-        # Additional wait for React components to render
-        human_delay(2.0, 3.0) if headless else human_delay(1.0, 2.0)
-        
-        # Try multiple methods to find and click the button
-        button_clicked = False
-        button_wait_timeout = 60 if headless else 30
-        button_wait = WebDriverWait(driver, button_wait_timeout)
-        
-        # Method 1: Try to find by data-cy attribute
-        logger.info("Method 1: Trying to find button by data-cy attribute")
+        # Find and click the button in-page: every fallback locator is tried in a
+        # single execute_script call, polled by one WebDriverWait
         try:
-            button = button_wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-cy="radio-text-help_today-compare_current"]'))
-            )
-            logger.info("Button found by data-cy attribute")
-            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", button)
-            human_delay(0.5, 1.0)
-            try:
-                button.click()
-            except Exception:
-                driver.execute_script("arguments[0].click();", button)
-            logger.info("Button clicked successfully (method 1)")
-            button_clicked = True
-            human_delay(0.5, 1.0)
+            button_wait.until(lambda d: d.execute_script(FIND_AND_CLICK_COMPARE_BUTTON_JS))
+            logger.info("'I want to compare my current insurance' button clicked successfully")
         except Exception as e:
-            logger.warning(f"Method 1 failed: {str(e)}")
-        
-        # Method 2: Try to find by text content (XPath)
-        if not button_clicked:
-            logger.info("Method 2: Trying to find button by text content (XPath)")
-            try:
-                button = button_wait.until(
-                    EC.element_to_be_clickable((By.XPATH, "//div[contains(text(), 'I want to compare my current insurance')]"))
-                )
-                logger.info("Button found by text content (XPath)")
-                driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", button)
-                human_delay(0.5, 1.0)
-                try:
-                    button.click()
-                except Exception:
-                    driver.execute_script("arguments[0].click();", button)
-                logger.info("Button clicked successfully (method 2)")
-                button_clicked = True
-                human_delay(0.5, 1.0)
-            except Exception as e:
-                logger.warning(f"Method 2 failed: {str(e)}")
-        
-        # Method 3: Try JavaScript-based finding and clicking
-        if not button_clicked:
-            logger.info("Method 3: Trying to find button using JavaScript")
-            try:
-                # Use JavaScript to find the element
-                button_found = driver.execute_script("""
-                    var elements = document.querySelectorAll('[data-cy="radio-text-help_today-compare_current"]');
-                    if (elements.length === 0) {
-                        elements = Array.from(document.querySelectorAll('div')).filter(el => 
-                            el.textContent && el.textContent.includes('I want to compare my current insurance')
-                        );
-                    }
-                    if (elements.length > 0) {
-                        elements[0].scrollIntoView({behavior: 'smooth', block: 'center'});
-                        return true;
-                    }
-                    return false;
-                """)
-                
-                if button_found:
-                    human_delay(1.0, 2.0)
-                    # Try to click using JavaScript
-                    clicked = driver.execute_script("""
-                        var elements = document.querySelectorAll('[data-cy="radio-text-help_today-compare_current"]');
-                        if (elements.length === 0) {
-                            elements = Array.from(document.querySelectorAll('div')).filter(el => 
-                                el.textContent && el.textContent.includes('I want to compare my current insurance')
-                            );
-                        }
-                        if (elements.length > 0) {
-                            elements[0].click();
-                            return true;
-                        }
-                        return false;
-                    """)
-                    if clicked:
-                        logger.info("Button clicked successfully (method 3 - JavaScript)")
-                        button_clicked = True
-                        human_delay(0.5, 1.0)
-            except Exception as e:
-                logger.warning(f"Method 3 failed: {str(e)}")
-        
-        # Method 4: Try finding by partial text match
-        if not button_clicked:
-            logger.info("Method 4: Trying to find button by partial text match")
-            try:
-                button = button_wait.until(
-                    EC.element_to_be_clickable((By.XPATH, "//div[contains(., 'compare my current insurance')]"))
-                )
-                logger.info("Button found by partial text")
-                driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", button)
-                human_delay(0.5, 1.0)
-                try:
-                    button.click()
-                except Exception:
-                    driver.execute_script("arguments[0].click();", button)
-                logger.info("Button clicked successfully (method 4)")
-                button_clicked = True
-                human_delay(0.5, 1.0)
-            except Exception as e:
-                logger.warning(f"Method 4 failed: {str(e)}")
-        
-        if not button_clicked:
-            error_msg = "Failed to find or click the button after trying all methods"
+            error_msg = f"Failed to find or click the button: {str(e)}"
             logger.error(error_msg)
             return {
                 "status": "error",
@@ -628,70 +2050,56 @@ async def start_bot(request: StartRequest):
                 "error_type": "ElementNotFoundError"
             }
         
-        # Human-like wait after clicking
+        # Steps 2 and 3 radios: "Other" residence ownership and "Sometime in the future"
+        # purchase timeframe
+        radio_steps = [
+            (2, RESIDENCE_OTHER_BUTTON, "Other"),
+            (3, PURCHASE_FUTURE_BUTTON, "Sometime in the future"),
+        ]
+        radio_selectors = [locator[1] for _, locator, _ in radio_steps]
+        
+        # Wait in-page for the step 2/3 radios to render, then take the human-like pause
         logger.info("Waiting for page to process the click")
+        if not await_selectors(driver, radio_selectors, WAIT_TIMEOUT * 1000):
+            logger.warning("Step 2/3 radios did not render in time, continuing anyway")
+        human_delay(0.5, 1.0)
         human_delay(0.8, 1.5)  # Faster wait
-        logger.info(f"Step 1 completed. Current URL: {driver.current_url}")
+        logger.info("Step 1 completed. Current URL: %s", driver.current_url)
         
-        # Step 2: Click the "Other" button for residence ownership
-        logger.info("Step 2: Looking for 'Other' residence ownership button")
+        # Click both radios with one in-page script; any radio it cannot find yet
+        # falls back to a Selenium wait-and-click
+        logger.info("Steps 2-3: Clicking 'Other' and 'Sometime in the future' buttons")
         try:
-            logger.info("Trying to find button by data-cy attribute: radio-text-residence_ownership-0-3")
-            button_step2 = wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-cy="radio-text-residence_ownership-0-3"]'))
-            )
-            logger.info("Step 2 button found")
-            
-            # Human-like behavior: scroll to element and move mouse
-            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", button_step2)
-            human_delay(0.4, 0.8)  # Faster wait after scroll
-            human_mouse_move(driver, button_step2)
-            human_delay(0.3, 0.6)  # Faster hesitation before click
-            
-            logger.info("Clicking Step 2 button...")
-            button_step2.click()
-            logger.info("Step 2 button clicked successfully")
-            
-            # Wait after click
-            human_delay(0.5, 1.0)
-            logger.info(f"Step 2 completed. Current URL: {driver.current_url}")
+            missing_selector = driver.execute_script(BULK_RADIO_CLICK_JS, radio_selectors)
         except Exception as e:
-            logger.error(f"Step 2 failed: Failed to find or click the 'Other' button: {str(e)}")
-            return {
-                "status": "error",
-                "message": f"Step 2 failed: Failed to find or click the 'Other' button: {str(e)}",
-                "error_type": type(e).__name__
-            }
+            logger.warning("Bulk radio click failed: %s", e)
+            missing_selector = radio_selectors[0]
+        pending_steps = radio_steps[radio_selectors.index(missing_selector):] if missing_selector else []
+        logger.info("Clicked %s of %s radios in-page", len(radio_steps) - len(pending_steps), len(radio_steps))
         
-        # Step 3: Click the "Sometime in the future" button for purchase timeframe
-        logger.info("Step 3: Looking for 'Sometime in the future' purchase timeframe button")
-        try:
-            logger.info("Trying to find button by data-cy attribute: radio-text-user_purchase_timeframe-0-FUTURE")
-            button_step3 = wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-cy="radio-text-user_purchase_timeframe-0-FUTURE"]'))
-            )
-            logger.info("Step 3 button found")
-            
-            # Human-like behavior: scroll to element and move mouse
-            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", button_step3)
-            human_delay(0.4, 0.8)  # Faster wait after scroll
-            human_mouse_move(driver, button_step3)
-            human_delay(0.3, 0.6)  # Faster hesitation before click
-            
-            logger.info("Clicking Step 3 button...")
-            button_step3.click()
-            logger.info("Step 3 button clicked successfully")
-            
-            # Wait after click
-            human_delay(0.5, 1.0)
-            logger.info(f"Step 3 completed. Current URL: {driver.current_url}")
-        except Exception as e:
-            logger.error(f"Step 3 failed: Failed to find or click the 'Sometime in the future' button: {str(e)}")
-            return {
-                "status": "error",
-                "message": f"Step 3 failed: Failed to find or click the 'Sometime in the future' button: {str(e)}",
-                "error_type": type(e).__name__
-            }
+        for step, locator, label in pending_steps:
+            logger.info("Step %s: Looking for '%s' button", step, label)
+            try:
+                logger.info("Trying to find button by selector: %s", locator[1])
+                wait_for_element(driver, wait, locator, EC.element_to_be_clickable)
+                logger.info("Step %s button found", step)
+                human_delay(0.3, 0.6)  # Faster hesitation before click
+                
+                # Scroll, move and click in one CDP burst
+                logger.info("Clicking Step %s button...", step)
+                cdp_human_click(driver, locator[1])
+                logger.info("Step %s button clicked successfully", step)
+                
+                # Wait after click
+                human_delay(0.5, 1.0)
+                logger.info("Step %s completed. Current URL: %s", step, driver.current_url)
+            except Exception as e:
+                logger.error("Step %s failed: Failed to find or click the '%s' button: %s", step, label, e)
+                return {
+                    "status": "error",
+                    "message": f"Step {step} failed: Failed to find or click the '{label}' button: {str(e)}",
+                    "error_type": type(e).__name__
+                }
         
         # Step 4: Click the "Save & continue" button and wait for new page
         logger.info("Step 4: Looking for 'Save & continue' button")
@@ -702,55 +2110,11 @@ async def start_bot(request: StartRequest):
             human_scroll(driver)
             human_delay(0.5, 1.0)
             
-            # Wait for button to be present first
-            button_step4 = wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, '[data-cy="primary-button_section-continue"]'))
-            )
-            logger.info("Step 4 button found, waiting for it to be enabled...")
-            
-            # Wait for button to be enabled (not disabled) with faster checking
-            max_wait_time = 10  # 10 seconds to wait for button to enable
-            start_time = time.time()
-            while time.time() - start_time < max_wait_time:
-                try:
-                    disabled_attr = button_step4.get_attribute("disabled")
-                    if disabled_attr is None:
-                        logger.info("Step 4 button is now enabled")
-                        break
-                    human_delay(0.5, 1.0)  # Faster check intervals
-                    button_step4 = driver.find_element(By.CSS_SELECTOR, '[data-cy="primary-button_section-continue"]')
-                except Exception:
-                    pass
-            else:
-                logger.warning("Button may still be disabled, but attempting to click anyway")
-            
-            # Get the button element again to ensure it's clickable
-            button_step4 = wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-cy="primary-button_section-continue"]'))
-            )
-            
-            # Human-like behavior: scroll to button and move mouse
-            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", button_step4)
-            human_delay(0.5, 1.0)  # Faster wait after scroll
-            human_mouse_move(driver, button_step4)
-            human_delay(0.4, 0.8)  # Faster pause before clicking
-            
-            # Store current URL before clicking
-            url_before_click = driver.current_url
-            logger.info("Clicking Step 4 button...")
-            button_step4.click()
-            logger.info("Step 4 button clicked successfully")
-            
-            # Wait for page to change (new page to load)
-            logger.info("Waiting for new page to load after clicking 'Save & continue'")
-            wait.until(lambda d: d.current_url != url_before_click)
-            logger.info("New page loaded")
-            
-            # Wait for page to fully render
-            human_delay(1.0, 1.5)
-            logger.info(f"Step 4 completed. New page URL: {driver.current_url}")
+            # Click Save & continue and wait for the next page
+            new_url = click_save_and_continue(driver, wait)
+            logger.info("Step 4 completed. New page URL: %s", new_url)
         except Exception as e:
-            logger.error(f"Step 4 failed: Failed to find, enable, or click the 'Save & continue' button: {str(e)}")
+            logger.error("Step 4 failed: Failed to find, enable, or click the 'Save & continue' button: %s", e)
             return {
                 "status": "error",
                 "message": f"Step 4 failed: Failed to find, enable, or click the 'Save & continue' button: {str(e)}",
@@ -763,108 +2127,55 @@ async def start_bot(request: StartRequest):
             logger.info("Trying to find input field by data-cy attribute: textinput-input-garaging_address")
             
             # Wait for the page to be ready and find the input field
-            address_input = wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, '[data-cy="textinput-input-garaging_address"]'))
-            )
+            address_input = wait_for_element(driver, wait, ADDRESS_INPUT, EC.presence_of_element_located)
             logger.info("Address input field found")
             
             # Human-like behavior: scroll to input field
-            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", address_input)
-            human_delay(0.4, 0.8)
+            scroll_into_view(driver, address_input, 0.4, 0.8)
             
             # Move mouse to input field
             human_mouse_move(driver, address_input)
             human_delay(0.3, 0.6)
             
-            # Helper function to get fresh element reference
-            def get_address_input():
-                return driver.find_element(By.CSS_SELECTOR, '[data-cy="textinput-input-garaging_address"]')
-            
             # Click on the input field to focus it
             logger.info("Clicking on address input field...")
-            try:
-                address_input.click()
-            except StaleElementReferenceException:
-                # Re-find element if stale
-                logger.info("Element became stale, re-finding...")
-                address_input = get_address_input()
-                address_input.click()
+            resilient(driver, ADDRESS_INPUT, lambda el: robust_click(driver, el), address_input)
             human_delay(0.3, 0.6)
             
             # Clear the field if it has any value
-            try:
-                address_input.clear()
-            except StaleElementReferenceException:
-                # Re-find element if stale
-                logger.info("Element became stale, re-finding...")
-                address_input = get_address_input()
-                address_input.clear()
+            resilient(driver, ADDRESS_INPUT, lambda el: el.clear(), address_input)
             human_delay(0.2, 0.4)
             
             # Type the address with faster human-like typing speed
             address = "3740 LAKE LYNN DR"
-            logger.info(f"Typing address: {address}")
+            logger.info("Typing address: %s", address)
             
-            # Type character by character with faster random delays
-            # Re-find element before typing to avoid stale reference
-            address_input = get_address_input()
-            for i, char in enumerate(address):
-                try:
-                    address_input.send_keys(char)
-                except StaleElementReferenceException:
-                    # Re-find element if it becomes stale during typing
-                    logger.debug("Element became stale during typing, re-finding...")
-                    address_input = get_address_input()
-                    address_input.send_keys(char)
-                time.sleep(random.uniform(0.02, 0.08))  # Faster typing speed
-                
-                # After typing a few characters, check if dropdown appears (but don't select yet)
-                if i > 5 and i % 3 == 0:  # Check every 3 chars after first 5
-                    try:
-                        # Just check if dropdown exists, don't interact yet
-                        driver.find_element(By.CSS_SELECTOR, '#ex-list-box, [id="ex-list-box"], ul[role="listbox"]')
-                        logger.debug("Dropdown is appearing while typing...")
-                    except Exception:
-                        pass  # Dropdown not ready yet, continue typing
+            # Insert the whole address with one CDP call; it fires the same input events as
+            # typing, so the suggestion list still opens
+            resilient(driver, ADDRESS_INPUT, lambda el: fast_type(driver, el, address), address_input)
             
             logger.info("Address typed successfully")
-            human_delay(0.8, 1.5)  # Wait a bit longer for dropdown to fully appear
             
             # Wait for dropdown to appear and select first option
             logger.info("Waiting for address dropdown to appear...")
             dropdown_option = None
             
-            # Try multiple selectors to find the first dropdown option
-            # Prioritize the specific address suggestion element
-            selectors = [
-                (By.CSS_SELECTOR, '#address-suggestion-0'),  # Specific ID
-                (By.CSS_SELECTOR, '.address-suggestion.suggestion-selected'),  # Class combination
-                (By.CSS_SELECTOR, '[id="address-suggestion-0"]'),  # ID attribute selector
-                (By.CSS_SELECTOR, '[role="option"][id="address-suggestion-0"]'),  # Role and ID
-                (By.XPATH, "//div[@id='address-suggestion-0']"),  # XPath by ID
-                (By.XPATH, "//div[@class='address-suggestion suggestion-selected']"),  # XPath by class
-                (By.XPATH, "//div[@role='option' and @id='address-suggestion-0']"),  # XPath by role and ID
-                (By.CSS_SELECTOR, '#ex-list-box li:first-child'),  # Fallback to first list item
-                (By.CSS_SELECTOR, '[id="ex-list-box"] li:first-child'),
-                (By.CSS_SELECTOR, 'ul[role="listbox"] li:first-child'),
-                (By.CSS_SELECTOR, '.autocomplete-option:first-child'),
-                (By.XPATH, "//ul[@role='listbox']//li[1]"),
-                (By.XPATH, "//div[@id='ex-list-box']//li[1]"),
-                (By.XPATH, "//li[@role='option'][1]"),
-                (By.XPATH, "//ul[contains(@class, 'autocomplete')]//li[1]"),
-            ]
-            
-            for selector_type, selector in selectors:
-                try:
-                    logger.info(f"Trying selector: {selector}")
-                    dropdown_option = wait.until(
-                        EC.element_to_be_clickable((selector_type, selector))
-                    )
-                    logger.info(f"Dropdown option found with selector: {selector}")
-                    break
-                except Exception as e:
-                    logger.debug(f"Selector {selector} failed: {str(e)}")
-                    continue
+            # Wait once for any of the suggestion selectors; browsers match a comma-joined
+            # CSS list in a single query, so there is no per-selector timeout to burn through
+            try:
+                dropdown_option = wait_for_element(driver, wait, ADDRESS_SUGGESTION_LOCATOR, EC.element_to_be_clickable)
+                logger.info("Dropdown option found with suggestion selector")
+            except Exception as e:
+                logger.debug("Suggestion selector failed: %s", e)
+                # XPath-only fallbacks, given a short wait since the CSS union already waited in full
+                for locator in ADDRESS_SUGGESTION_XPATH_FALLBACKS:
+                    try:
+                        logger.info("Trying selector: %s", locator[1])
+                        dropdown_option = quick_wait.until(EC.element_to_be_clickable(locator))
+                        logger.info("Dropdown option found with selector: %s", locator[1])
+                        break
+                    except Exception as e:
+                        logger.debug("Selector %s failed: %s", locator[1], e)
             
             if dropdown_option is None:
                 logger.error("Could not find dropdown option with any selector")
@@ -878,40 +2189,32 @@ async def start_bot(request: StartRequest):
             logger.info("Selecting first option from dropdown...")
             try:
                 # Scroll to the option if needed
-                driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", dropdown_option)
-                human_delay(0.3, 0.6)
+                scroll_into_view(driver, dropdown_option, 0.3, 0.6)
                 
                 # Move mouse to option and click
                 human_mouse_move(driver, dropdown_option)
                 human_delay(0.2, 0.4)
                 
-                dropdown_option.click()
+                robust_click(driver, dropdown_option)
                 logger.info("First dropdown option selected successfully")
             except StaleElementReferenceException:
                 # Re-find and click if element becomes stale
                 logger.info("Dropdown option became stale, re-finding...")
-                # Try the specific address-suggestion-0 first
-                try:
-                    dropdown_option = driver.find_element(By.CSS_SELECTOR, '#address-suggestion-0')
-                    dropdown_option.click()
-                    logger.info("First dropdown option selected successfully after re-finding")
-                except Exception:
-                    # Fallback to other selectors
-                    for selector_type, selector in selectors:
-                        try:
-                            dropdown_option = driver.find_element(selector_type, selector)
-                            dropdown_option.click()
-                            logger.info("First dropdown option selected successfully after re-finding")
-                            break
-                        except Exception:
-                            continue
+                for locator in (ADDRESS_SUGGESTION_LOCATOR,) + ADDRESS_SUGGESTION_XPATH_FALLBACKS:
+                    try:
+                        dropdown_option = driver.find_element(*locator)
+                        robust_click(driver, dropdown_option)
+                        logger.info("First dropdown option selected successfully after re-finding")
+                        break
+                    except WebDriverException:
+                        continue
             
             # Wait for the selection to be processed
             human_delay(0.8, 1.5)
-            logger.info(f"Step 5 completed. Current URL: {driver.current_url}")
+            logger.info("Step 5 completed. Current URL: %s", driver.current_url)
             
         except Exception as e:
-            logger.error(f"Step 5 failed: Failed to find or fill the address field: {str(e)}")
+            logger.error("Step 5 failed: Failed to find or fill the address field: %s", e)
             return {
                 "status": "error",
                 "message": f"Step 5 failed: Failed to find or fill the address field: {str(e)}",
@@ -921,168 +2224,57 @@ async def start_bot(request: StartRequest):
         # Step 6: Fill first name, last name, date of birth, and click Save & continue
         logger.info("Step 6: Filling personal information fields")
         try:
-            # Helper function to get fresh element reference
-            def get_element_by_data_cy(data_cy_value):
-                return driver.find_element(By.CSS_SELECTOR, f'[data-cy="{data_cy_value}"]')
-            
-            # Fill first name
-            logger.info("Filling first name field with 'moazam'")
-            try:
-                first_name_input = wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '[data-cy="textinput-input-first_name-0"]'))
-                )
-                driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", first_name_input)
-                human_delay(0.3, 0.6)
-                human_mouse_move(driver, first_name_input)
-                human_delay(0.2, 0.4)
-                first_name_input.click()
-                human_delay(0.2, 0.4)
-                first_name_input.clear()
-                human_delay(0.1, 0.3)
-                
-                # Type first name
-                first_name = "moazam"
-                for char in first_name:
-                    try:
-                        first_name_input.send_keys(char)
-                    except StaleElementReferenceException:
-                        first_name_input = get_element_by_data_cy("textinput-input-first_name-0")
-                        first_name_input.send_keys(char)
-                    time.sleep(random.uniform(0.02, 0.08))
-                logger.info("First name filled successfully")
-                human_delay(0.3, 0.6)
-                
-            except Exception as e:
-                logger.error(f"Failed to fill first name: {str(e)}")
-                return {
-                    "status": "error",
-                    "message": f"Step 6 failed: Could not fill first name: {str(e)}",
-                    "error_type": type(e).__name__
-                }
-            
-            # Fill last name
-            logger.info("Filling last name field with 'ali'")
-            try:
-                last_name_input = wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '[data-cy="textinput-input-last_name-0"]'))
-                )
-                driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", last_name_input)
-                human_delay(0.3, 0.6)
-                human_mouse_move(driver, last_name_input)
-                human_delay(0.2, 0.4)
-                last_name_input.click()
-                human_delay(0.2, 0.4)
-                last_name_input.clear()
-                human_delay(0.1, 0.3)
-                
-                # Type last name
-                last_name = "ali"
-                for char in last_name:
-                    try:
-                        last_name_input.send_keys(char)
-                    except StaleElementReferenceException:
-                        last_name_input = get_element_by_data_cy("textinput-input-last_name-0")
-                        last_name_input.send_keys(char)
-                    time.sleep(random.uniform(0.02, 0.08))
-                logger.info("Last name filled successfully")
-                human_delay(0.3, 0.6)
-                
-            except Exception as e:
-                logger.error(f"Failed to fill last name: {str(e)}")
-                return {
-                    "status": "error",
-                    "message": f"Step 6 failed: Could not fill last name: {str(e)}",
-                    "error_type": type(e).__name__
-                }
+            # First name, last name and date of birth (just numbers, website will format it).
+            # None of them drives an autocomplete, so all three are set with one in-page
+            # script; any field it cannot find yet falls back to a Selenium wait-and-type
+            personal_fields = [
+                (FIRST_NAME_INPUT, "moazam", "first name"),
+                (LAST_NAME_INPUT, "ali", "last name"),
+                (DOB_INPUT, "11112000", "date of birth"),
+            ]
+            field_selectors = [locator[1] for locator, _, _ in personal_fields]
             
-            # Fill date of birth (just numbers: 11112000)
-            logger.info("Filling date of birth field with '11112000'")
+            if await_selectors(driver, field_selectors, WAIT_TIMEOUT * 1000) is False:
+                logger.warning("Step 6 fields did not render in time, continuing anyway")
+            logger.info("Filling first name, last name and date of birth in-page")
             try:
-                dob_input = wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '[data-cy="textinput-input-date_of_birth-0"]'))
-                )
-                driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", dob_input)
-                human_delay(0.3, 0.6)
-                human_mouse_move(driver, dob_input)
-                human_delay(0.2, 0.4)
-                dob_input.click()
-                human_delay(0.2, 0.4)
-                dob_input.clear()
-                human_delay(0.1, 0.3)
-                
-                # Type date of birth (just numbers, website will format it)
-                date_of_birth = "11112000"
-                for char in date_of_birth:
-                    try:
-                        dob_input.send_keys(char)
-                    except StaleElementReferenceException:
-                        dob_input = get_element_by_data_cy("textinput-input-date_of_birth-0")
-                        dob_input.send_keys(char)
-                    time.sleep(random.uniform(0.02, 0.08))
-                logger.info("Date of birth filled successfully")
-                human_delay(0.5, 1.0)
-                
-            except Exception as e:
-                logger.error(f"Failed to fill date of birth: {str(e)}")
-                return {
-                    "status": "error",
-                    "message": f"Step 6 failed: Could not fill date of birth: {str(e)}",
-                    "error_type": type(e).__name__
-                }
+                missing_selector = driver.execute_script(
+                    BULK_FILL_INPUTS_JS, [[locator[1], value] for locator, value, _ in personal_fields]
+                )
+            except Exception as e:
+                logger.warning("Bulk field fill failed: %s", e)
+                missing_selector = field_selectors[0]
+            pending_fields = personal_fields[field_selectors.index(missing_selector):] if missing_selector else []
+            logger.info("Filled %s of %s fields in-page", len(personal_fields) - len(pending_fields), len(personal_fields))
+            
+            for locator, value, label in pending_fields:
+                logger.info("Filling %s field with '%s'", label, value)
+                try:
+                    field_input = wait_for_element(driver, wait, locator, EC.presence_of_element_located)
+                    scroll_into_view(driver, field_input, 0.3, 0.6)
+                    human_mouse_move(driver, field_input)
+                    resilient(driver, locator, lambda el: (el.click(), el.clear(), el.send_keys(value)), field_input)
+                    logger.info("%s filled successfully", label.capitalize())
+                except Exception as e:
+                    logger.error("Failed to fill %s: %s", label, e)
+                    return {
+                        "status": "error",
+                        "message": f"Step 6 failed: Could not fill {label}: {str(e)}",
+                        "error_type": type(e).__name__
+                    }
+            human_delay(0.5, 1.0)
             
             # Click Save & continue button
             logger.info("Step 6: Looking for 'Save & continue' button")
             try:
                 logger.info("Trying to find button by data-cy attribute: primary-button_section-continue")
                 
-                # Wait for button to be present and enabled
-                button_step6 = wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '[data-cy="primary-button_section-continue"]'))
-                )
-                logger.info("Step 6 button found, waiting for it to be enabled...")
-                
-                # Wait for button to be enabled
-                max_wait_time = 10
-                start_time = time.time()
-                while time.time() - start_time < max_wait_time:
-                    try:
-                        disabled_attr = button_step6.get_attribute("disabled")
-                        if disabled_attr is None:
-                            logger.info("Step 6 button is now enabled")
-                            break
-                        human_delay(0.5, 1.0)
-                        button_step6 = driver.find_element(By.CSS_SELECTOR, '[data-cy="primary-button_section-continue"]')
-                    except Exception:
-                        pass
-                
-                # Get the button element again to ensure it's clickable
-                button_step6 = wait.until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-cy="primary-button_section-continue"]'))
-                )
-                
-                # Human-like behavior: scroll to button and move mouse
-                driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", button_step6)
-                human_delay(0.5, 1.0)
-                human_mouse_move(driver, button_step6)
-                human_delay(0.4, 0.8)
-                
-                # Store current URL before clicking
-                url_before_click = driver.current_url
-                logger.info("Clicking Step 6 button...")
-                button_step6.click()
-                logger.info("Step 6 button clicked successfully")
-                
-                # Wait for page to change (new page to load)
-                logger.info("Waiting for new page to load after clicking 'Save & continue'")
-                wait.until(lambda d: d.current_url != url_before_click)
-                logger.info("New page loaded")
-                
-                # Wait for page to fully render
-                human_delay(1.0, 1.5)
-                logger.info(f"Step 6 completed. New page URL: {driver.current_url}")
+                # Click Save & continue and wait for the next page
+                new_url = click_save_and_continue(driver, wait)
+                logger.info("Step 6 completed. New page URL: %s", new_url)
                 
             except Exception as e:
-                logger.error(f"Step 6 failed: Failed to find, enable, or click the 'Save & continue' button: {str(e)}")
+                logger.error("Step 6 failed: Failed to find, enable, or click the 'Save & continue' button: %s", e)
                 return {
                     "status": "error",
                     "message": f"Step 6 failed: Failed to find, enable, or click the 'Save & continue' button: {str(e)}",
@@ -1090,7 +2282,7 @@ async def start_bot(request: StartRequest):
                 }
             
         except Exception as e:
-            logger.error(f"Step 6 failed: {str(e)}")
+            logger.error("Step 6 failed: %s", e)
             return {
                 "status": "error",
                 "message": f"Step 6 failed: {str(e)}",
@@ -1102,7 +2294,7 @@ async def start_bot(request: StartRequest):
             logger.info("Step 7: Selecting vehicle information")
             try:
                 # Select year
-                if not select_custom_dropdown(driver, wait, "dropdown-search-vehicles-0-year", request.year, "Year"):
+                if not select_dropdown_option(driver, wait, "dropdown-search-vehicles-0-year", request.year, "Year"):
                     return {
                         "status": "error",
                         "message": "Step 7 failed: Could not select vehicle year",
@@ -1110,7 +2302,7 @@ async def start_bot(request: StartRequest):
                     }
                 
                 # Select make
-                if not select_custom_dropdown(driver, wait, "dropdown-search-vehicles-0-make", request.make, "Make"):
+                if not select_dropdown_option(driver, wait, "dropdown-search-vehicles-0-make", request.make, "Make"):
                     return {
                         "status": "error",
                         "message": "Step 7 failed: Could not select vehicle make",
@@ -1118,7 +2310,7 @@ async def start_bot(request: StartRequest):
                     }
                 
                 # Select model
-                if not select_custom_dropdown(driver, wait, "dropdown-search-vehicles-0-model", request.model, "Model"):
+                if not select_dropdown_option(driver, wait, "dropdown-search-vehicles-0-model", request.model, "Model"):
                     return {
                         "status": "error",
                         "message": "Step 7 failed: Could not select vehicle model",
@@ -1128,91 +2320,38 @@ async def start_bot(request: StartRequest):
                 # Select trim (same approach as year/make/model: click control and press Enter)
                 logger.info("Selecting vehicle trim (first option)...")
                 try:
-                    # Find the trim dropdown input first (same as year/make/model)
-                    trim_input = wait.until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, '[data-cy="dropdown-search-vehicles-0-submodel"]'))
-                    )
-                    
-                    # Find the parent control container to click on (same as year/make/model)
-                    try:
-                        control_container = trim_input.find_element(By.XPATH, "./ancestor::div[contains(@class, 'custom-dropdown__control')]")
-                    except Exception:
-                        control_container = driver.find_element(By.XPATH, "//input[@data-cy='dropdown-search-vehicles-0-submodel']/ancestor::div[contains(@class, 'custom-dropdown__control')]")
+                    # Find the control container around the trim input to click on
+                    control_container = dropdown_control(driver, TRIM_INPUT[1], QUICK_WAIT_TIMEOUT)
                     
                     # Check if trim is already selected (has a selected value)
                     try:
-                        selected_value_elements = control_container.find_elements(By.CSS_SELECTOR, '.custom-dropdown__single-value')
-                        if selected_value_elements and selected_value_elements[0].text.strip():
-                            logger.info(f"Trim is already preset to '{selected_value_elements[0].text.strip()}', skipping selection")
+                        preset_trim = driver.execute_script(DROPDOWN_SELECTED_TEXT_JS, TRIM_INPUT[1])
+                        if preset_trim:
+                            logger.info("Trim is already preset to '%s', skipping selection", preset_trim)
                         else:
                             # Trim is not preset, click the dropdown indicator (arrow) first, then press Enter
                             logger.info("Trim field is empty, clicking dropdown indicator to open...")
                             
                             # Scroll to dropdown control
-                            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", control_container)
-                            human_delay(0.3, 0.6)
+                            scroll_into_view(driver, control_container, 0.3, 0.6)
                             human_mouse_move(driver, control_container)
                             human_delay(0.2, 0.4)
                             
-                            # Click to open dropdown - try multiple methods
+                            # Open the dropdown with a JS click on the indicator (arrow button), falling back to
+                            # the control container only if no options appear within a short wait
                             logger.info("Clicking to open trim dropdown...")
-                            dropdown_opened = False
-                            
-                            # Method 1: Try clicking the indicator (arrow button) using JavaScript
-                            try:
-                                indicator = control_container.find_element(By.CSS_SELECTOR, '.custom-dropdown__indicator')
-                                logger.info("Found dropdown indicator, clicking with JavaScript...")
-                                driver.execute_script("arguments[0].click();", indicator)
-                                human_delay(0.5, 1.0)
-                                # Check if dropdown opened by looking for options
-                                try:
-                                    driver.find_element(By.CSS_SELECTOR, '.custom-dropdown__option, [role="option"]')
-                                    logger.info("Dropdown opened successfully via indicator click")
-                                    dropdown_opened = True
-                                except Exception:
-                                    logger.info("Indicator click may not have opened dropdown, trying other methods...")
-                            except Exception as e:
-                                logger.debug(f"Indicator click failed: {str(e)}")
-                            
-                            # Method 2: If indicator didn't work, try clicking the control container
-                            if not dropdown_opened:
-                                try:
-                                    logger.info("Trying to click control container...")
-                                    driver.execute_script("arguments[0].click();", control_container)
-                                    human_delay(0.5, 1.0)
-                                    # Check if dropdown opened
-                                    try:
-                                        driver.find_element(By.CSS_SELECTOR, '.custom-dropdown__option, [role="option"]')
-                                        logger.info("Dropdown opened successfully via control container click")
-                                        dropdown_opened = True
-                                    except Exception:
-                                        logger.info("Control container click may not have opened dropdown, trying input click...")
-                                except Exception as e:
-                                    logger.debug(f"Control container click failed: {str(e)}")
-                            
-                            # Method 3: If still not open, try clicking the input field
-                            if not dropdown_opened:
-                                try:
-                                    logger.info("Trying to click input field directly...")
-                                    trim_input = driver.find_element(By.CSS_SELECTOR, '[data-cy="dropdown-search-vehicles-0-submodel"]')
-                                    driver.execute_script("arguments[0].click();", trim_input)
-                                    human_delay(0.5, 1.0)
-                                    logger.info("Input field clicked")
-                                    dropdown_opened = True
-                                except Exception as e:
-                                    logger.warning(f"Input field click also failed: {str(e)}")
-                            
-                            if not dropdown_opened:
+                            open_targets = control_container.find_elements(By.CSS_SELECTOR, '.custom-dropdown__indicator')[:1] + [control_container]
+                            for open_target in open_targets:
+                                driver.execute_script("arguments[0].click();", open_target)
+                                if wait_for(lambda: driver.find_elements(*DROPDOWN_OPTION), timeout=3, cap=WAIT_POLL_FREQUENCY):
+                                    logger.info("Trim dropdown opened, options are present")
+                                    break
+                                logger.info("Click did not open trim dropdown, trying next target...")
+                            else:
                                 logger.warning("Could not open dropdown, but will try to proceed with Enter key")
                             
-                            # Wait for dropdown to fully open and options to appear
-                            logger.info("Waiting for dropdown options to appear...")
-                            human_delay(1.0, 1.5)  # Wait longer for dropdown to fully open
-                            
                             # Re-find the input field to ensure it's focused
-                            trim_input = wait.until(
-                                EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-cy="dropdown-search-vehicles-0-submodel"]'))
-                            )
+                            trim_input = wait_for_element(driver, wait, TRIM_INPUT, EC.element_to_be_clickable)
                             
                             # Ensure input is focused before pressing Enter
                             try:
@@ -1222,50 +2361,42 @@ async def start_bot(request: StartRequest):
                                 human_delay(0.3, 0.6)
                                 
                                 # Also try clicking it
-                                try:
-                                    trim_input.click()
-                                    logger.info("Trim input field clicked")
-                                    human_delay(0.2, 0.4)
-                                except Exception:
-                                    pass
+                                robust_click(driver, trim_input)
+                                logger.info("Trim input field clicked")
+                                human_delay(0.2, 0.4)
                             except Exception as focus_err:
-                                logger.warning(f"Could not focus input: {str(focus_err)}")
+                                logger.warning("Could not focus input: %s", focus_err)
                             
                             # Press Enter to auto-select the first option
                             logger.info("Pressing Enter to select first trim option...")
                             try:
-                                trim_input.send_keys(Keys.RETURN)
+                                cdp_press_enter(driver)
                                 logger.info("Enter key pressed successfully")
-                            except Exception as enter_err:
-                                # If send_keys fails, try JavaScript
-                                logger.warning(f"Send keys failed: {str(enter_err)}, trying JavaScript")
-                                driver.execute_script("arguments[0].dispatchEvent(new KeyboardEvent('keydown', {key: 'Enter', code: 'Enter', keyCode: 13, which: 13, bubbles: true}));", trim_input)
-                                driver.execute_script("arguments[0].dispatchEvent(new KeyboardEvent('keyup', {key: 'Enter', code: 'Enter', keyCode: 13, which: 13, bubbles: true}));", trim_input)
-                                logger.info("Enter key simulated via JavaScript")
-                            
-                            human_delay(1.0, 1.5)  # Wait longer for selection to process
+                            except WebDriverException as enter_err:
+                                # If the CDP key event fails, fall back to send_keys
+                                logger.warning("CDP key event failed: %s, trying send_keys", enter_err)
+                                trim_input.send_keys(Keys.RETURN)
+                                logger.info("Enter key pressed via send_keys")
                             
-                            # Verify selection was made
+                            # Wait for the selected value to render, which also verifies the selection
                             try:
-                                # Re-find control container to check for selected value
-                                control_container = driver.find_element(By.XPATH, "//input[@data-cy='dropdown-search-vehicles-0-submodel']/ancestor::div[contains(@class, 'custom-dropdown__control')]")
-                                selected_value = control_container.find_element(By.CSS_SELECTOR, '.custom-dropdown__single-value')
-                                if selected_value and selected_value.text.strip():
-                                    logger.info(f"Trim successfully selected: '{selected_value.text.strip()}'")
+                                selected_trim = wait_for(lambda: driver.execute_script(DROPDOWN_SELECTED_TEXT_JS, TRIM_INPUT[1]), timeout=1.5, cap=WAIT_POLL_FREQUENCY)
+                                if selected_trim:
+                                    logger.info("Trim successfully selected: '%s'", selected_trim)
                                 else:
                                     logger.warning("Trim selection may not have worked, but continuing...")
                             except Exception:
                                 logger.info("Could not verify trim selection, but continuing...")
                     except Exception as e:
-                        logger.info(f"Could not check or select trim: {str(e)}, skipping trim selection")
+                        logger.info("Could not check or select trim: %s, skipping trim selection", e)
                             
                 except Exception as e:
-                    logger.info(f"Trim dropdown not found or not available: {str(e)}, skipping trim selection")
+                    logger.info("Trim dropdown not found or not available: %s, skipping trim selection", e)
                 
-                logger.info(f"Step 7 completed. Current URL: {driver.current_url}")
+                logger.info("Step 7 completed. Current URL: %s", driver.current_url)
                 
             except Exception as e:
-                logger.error(f"Step 7 failed: {str(e)}")
+                logger.error("Step 7 failed: %s", e)
                 return {
                     "status": "error",
                     "message": f"Step 7 failed: {str(e)}",
@@ -1279,72 +2410,19 @@ async def start_bot(request: StartRequest):
         try:
             # Click the "No" radio button
             logger.info("Looking for 'No' radio button for adding another vehicle")
-            no_button = wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-cy="radio-text-addAnother-vehicle-1-0"]'))
-            )
-            
-            # Scroll to button
-            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", no_button)
-            human_delay(0.3, 0.6)
-            human_mouse_move(driver, no_button)
-            human_delay(0.2, 0.4)
-            
-            # Click the "No" button
-            no_button.click()
+            click_locator(driver, wait, ADD_ANOTHER_VEHICLE_NO)
             logger.info("'No' button clicked successfully")
-            human_delay(0.5, 1.0)
+            human_delay(0.3, 0.5)
             
             # Click "Save & continue" button
             logger.info("Looking for 'Save & continue' button")
             try:
-                # Wait for button to be present and enabled
-                save_button = wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '[data-cy="primary-button_section-continue"]'))
-                )
-                logger.info("Save & continue button found, waiting for it to be enabled...")
-                
-                # Wait for button to be enabled
-                max_wait_time = 10
-                start_time = time.time()
-                while time.time() - start_time < max_wait_time:
-                    try:
-                        disabled_attr = save_button.get_attribute("disabled")
-                        if disabled_attr is None:
-                            logger.info("Save & continue button is now enabled")
-                            break
-                        human_delay(0.5, 1.0)
-                        save_button = driver.find_element(By.CSS_SELECTOR, '[data-cy="primary-button_section-continue"]')
-                    except Exception:
-                        pass
-                
-                # Get the button element again to ensure it's clickable
-                save_button = wait.until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-cy="primary-button_section-continue"]'))
-                )
-                
-                # Human-like behavior: scroll to button and move mouse
-                driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", save_button)
-                human_delay(0.5, 1.0)
-                human_mouse_move(driver, save_button)
-                human_delay(0.4, 0.8)
-                
-                # Store current URL before clicking
-                url_before_click = driver.current_url
-                logger.info("Clicking Save & continue button...")
-                save_button.click()
-                logger.info("Save & continue button clicked successfully")
-                
-                # Wait for page to change (new page to load)
-                logger.info("Waiting for new page to load after clicking 'Save & continue'")
-                wait.until(lambda d: d.current_url != url_before_click)
-                logger.info("New page loaded")
-                
-                # Wait for page to fully render
-                human_delay(1.0, 1.5)
-                logger.info(f"Step 8 completed. New page URL: {driver.current_url}")
+                # Click Save & continue and wait for the next page
+                new_url = click_save_and_continue(driver, wait)
+                logger.info("Step 8 completed. New page URL: %s", new_url)
                 
             except Exception as e:
-                logger.error(f"Step 8 failed: Failed to find, enable, or click the 'Save & continue' button: {str(e)}")
+                logger.error("Step 8 failed: Failed to find, enable, or click the 'Save & continue' button: %s", e)
                 return {
                     "status": "error",
                     "message": f"Step 8 failed: Failed to find, enable, or click the 'Save & continue' button: {str(e)}",
@@ -1352,7 +2430,7 @@ async def start_bot(request: StartRequest):
                 }
             
         except Exception as e:
-            logger.error(f"Step 8 failed: Failed to click 'No' button: {str(e)}")
+            logger.error("Step 8 failed: Failed to click 'No' button: %s", e)
             return {
                 "status": "error",
                 "message": f"Step 8 failed: Failed to click 'No' button: {str(e)}",
@@ -1362,210 +2440,18 @@ async def start_bot(request: StartRequest):
         # Step 9: Fill vehicle ownership, primary use, miles, and ownership duration
         logger.info("Step 9: Filling vehicle ownership and usage information")
         try:
-            # 1. Click vehicle ownership radio button (click the label or text element)
-            logger.info("Clicking vehicle ownership radio button")
-            try:
-                # Try clicking the text element first (more reliable)
-                ownership_radio = wait.until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-cy="radio-text-vehicle-ownership-0-0"]'))
-                )
-            except Exception:
-                # Fallback: try the label
-                try:
-                    ownership_radio = wait.until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-cy="radio-vehicle-ownership-0-0"]'))
-                    )
-                except Exception:
-                    # Last fallback: try the input
-                    ownership_radio = wait.until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-cy="radio-input-vehicle-ownership-0-0"]'))
-                    )
-            
-            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", ownership_radio)
-            human_delay(0.3, 0.6)
-            human_mouse_move(driver, ownership_radio)
-            human_delay(0.2, 0.4)
-            
-            try:
-                ownership_radio.click()
-            except Exception:
-                # If click fails, use JavaScript click
-                driver.execute_script("arguments[0].click();", ownership_radio)
-            
-            logger.info("Vehicle ownership radio button clicked successfully")
-            human_delay(0.5, 1.0)
-            
-            # 2. Click primary use radio button "Commuting (to work or school)"
-            logger.info("Clicking primary use radio button: Commuting (to work or school)")
-            primary_use_radio = wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-cy="radio-text-vehicle-primary_use-0-0"]'))
-            )
-            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", primary_use_radio)
-            human_delay(0.3, 0.6)
-            human_mouse_move(driver, primary_use_radio)
-            human_delay(0.2, 0.4)
-            
-            try:
-                primary_use_radio.click()
-            except Exception:
-                # If click fails, use JavaScript click
-                driver.execute_script("arguments[0].click();", primary_use_radio)
-            
-            logger.info("Primary use radio button clicked successfully")
-            human_delay(0.5, 1.0)
-            
-            # 3. Enter miles: 1000
-            logger.info("Entering miles: 1000")
-            miles_input = wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, '[data-cy="textinput-input-miles-0"]'))
-            )
-            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", miles_input)
-            human_delay(0.3, 0.6)
-            human_mouse_move(driver, miles_input)
-            human_delay(0.2, 0.4)
-            miles_input.click()
-            human_delay(0.2, 0.4)
-            
-            # Clear and type miles
-            try:
-                miles_input.clear()
-            except Exception:
-                miles_input.send_keys(Keys.CONTROL + "a")
-                miles_input.send_keys(Keys.DELETE)
-            human_delay(0.2, 0.4)
-            
-            # Type 1000
-            miles_value = "1000"
-            for char in miles_value:
-                try:
-                    miles_input.send_keys(char)
-                except StaleElementReferenceException:
-                    miles_input = driver.find_element(By.CSS_SELECTOR, '[data-cy="textinput-input-miles-0"]')
-                    miles_input.send_keys(char)
-                time.sleep(random.uniform(0.02, 0.08))
-            logger.info("Miles entered successfully")
-            human_delay(0.5, 1.0)
-            
-            # 4. Find and fill ownership duration dropdown (type "1 month - 1 year" and press Enter)
-            logger.info("Filling vehicle ownership duration dropdown")
-            try:
-                # Use the exact data-cy value for ownership duration
-                duration_data_cy = "dropdown-search-vehicle-ownership_length-0"
-                logger.info(f"Looking for ownership duration dropdown with data-cy: {duration_data_cy}")
-                
-                # Find the duration dropdown input
-                duration_input = wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, f'[data-cy="{duration_data_cy}"]'))
-                )
-                logger.info("Ownership duration dropdown found")
-                
-                # Find the control container
-                try:
-                    control_container = duration_input.find_element(By.XPATH, "./ancestor::div[contains(@class, 'custom-dropdown__control')]")
-                except Exception:
-                    control_container = driver.find_element(By.XPATH, f"//input[@data-cy='{duration_data_cy}']/ancestor::div[contains(@class, 'custom-dropdown__control')]")
-                
-                # Click the control container to open dropdown (same as year/make/model)
-                driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", control_container)
-                human_delay(0.3, 0.6)
-                human_mouse_move(driver, control_container)
-                human_delay(0.2, 0.4)
-                
-                logger.info("Clicking ownership duration dropdown...")
-                try:
-                    control_container.click()
-                except Exception:
-                    driver.execute_script("arguments[0].click();", control_container)
-                
-                human_delay(0.5, 1.0)  # Wait for dropdown to open
-                
-                # Re-find input and type the value
-                duration_input = wait.until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, f'[data-cy="{duration_data_cy}"]'))
-                )
-                
-                # Clear and type "1 month - 1 year"
-                try:
-                    duration_input.clear()
-                except Exception:
-                    duration_input.send_keys(Keys.CONTROL + "a")
-                    duration_input.send_keys(Keys.DELETE)
-                human_delay(0.2, 0.4)
-                
-                logger.info("Typing '1 month - 1 year' in ownership duration field...")
-                duration_value = "1 month - 1 year"
-                for char in duration_value:
-                    try:
-                        duration_input.send_keys(char)
-                    except StaleElementReferenceException:
-                        duration_input = driver.find_element(By.CSS_SELECTOR, f'[data-cy="{duration_data_cy}"]')
-                        duration_input.send_keys(char)
-                    time.sleep(random.uniform(0.05, 0.12))
-                
-                logger.info("Finished typing, waiting for dropdown options to filter...")
-                human_delay(0.8, 1.5)  # Wait for options to filter
-                
-                # Press Enter to select first option
-                logger.info("Pressing Enter to select first option...")
-                duration_input.send_keys(Keys.RETURN)
-                logger.info("Ownership duration '1 month - 1 year' selected successfully")
-                human_delay(0.5, 1.0)
-                    
-            except Exception as e:
-                logger.error(f"Could not fill ownership duration: {str(e)}", exc_info=True)
-                logger.warning("Continuing despite ownership duration error...")
+            # Ownership, primary use, miles and ownership duration
+            run_form_actions(driver, wait, STEP9_ACTIONS)
             
-            # 5. Click "Save & continue" button and wait for new page
+            # Click "Save & continue" button and wait for new page
             logger.info("Looking for 'Save & continue' button")
             try:
-                # Wait for button to be present and enabled
-                save_button = wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '[data-cy="primary-button_section-continue"]'))
-                )
-                logger.info("Save & continue button found, waiting for it to be enabled...")
-                
-                # Wait for button to be enabled
-                max_wait_time = 10
-                start_time = time.time()
-                while time.time() - start_time < max_wait_time:
-                    try:
-                        disabled_attr = save_button.get_attribute("disabled")
-                        if disabled_attr is None:
-                            logger.info("Save & continue button is now enabled")
-                            break
-                        human_delay(0.5, 1.0)
-                        save_button = driver.find_element(By.CSS_SELECTOR, '[data-cy="primary-button_section-continue"]')
-                    except Exception:
-                        pass
-                
-                # Get the button element again to ensure it's clickable
-                save_button = wait.until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-cy="primary-button_section-continue"]'))
-                )
-                
-                # Human-like behavior: scroll to button and move mouse
-                driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", save_button)
-                human_delay(0.5, 1.0)
-                human_mouse_move(driver, save_button)
-                human_delay(0.4, 0.8)
-                
-                # Store current URL before clicking
-                url_before_click = driver.current_url
-                logger.info("Clicking Save & continue button...")
-                save_button.click()
-                logger.info("Save & continue button clicked successfully")
-                
-                # Wait for page to change (new page to load)
-                logger.info("Waiting for new page to load after clicking 'Save & continue'")
-                wait.until(lambda d: d.current_url != url_before_click)
-                logger.info("New page loaded")
-                
-                # Wait for page to fully render
-                human_delay(1.0, 1.5)
-                logger.info(f"Step 9 completed. New page URL: {driver.current_url}")
+                # Click Save & continue and wait for the next page
+                new_url = click_save_and_continue(driver, wait)
+                logger.info("Step 9 completed. New page URL: %s", new_url)
                 
             except Exception as e:
-                logger.error(f"Step 9 failed: Failed to find, enable, or click the 'Save & continue' button: {str(e)}")
+                logger.error("Step 9 failed: Failed to find, enable, or click the 'Save & continue' button: %s", e)
                 return {
                     "status": "error",
                     "message": f"Step 9 failed: Failed to find, enable, or click the 'Save & continue' button: {str(e)}",
@@ -1573,7 +2459,7 @@ async def start_bot(request: StartRequest):
                 }
             
         except Exception as e:
-            logger.error(f"Step 9 failed: {str(e)}", exc_info=True)
+            logger.error("Step 9 failed: %s", e, exc_info=True)
             return {
                 "status": "error",
                 "message": f"Step 9 failed: {str(e)}",
@@ -1584,237 +2470,18 @@ async def start_bot(request: StartRequest):
         # Step 10: Fill personal information, employment, insurance details, and contact info
         logger.info("Step 10: Filling personal information and insurance details")
         try:
-            # Helper function to click radio button (tries text, label, then input)
-            def click_radio_button(data_cy_text):
-                try:
-                    # Try text element first
-                    radio = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, f'[data-cy="{data_cy_text}"]')))
-                except Exception:
-                    # Try label
-                    try:
-                        radio = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, f'label[data-cy*="{data_cy_text.split("-")[-1]}"]')))
-                    except Exception:
-                        # Try input
-                        radio = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, f'input[data-cy*="{data_cy_text.split("-")[-1]}"]')))
-                
-                driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", radio)
-                human_delay(0.3, 0.6)
-                human_mouse_move(driver, radio)
-                human_delay(0.2, 0.4)
-                try:
-                    radio.click()
-                except Exception:
-                    driver.execute_script("arguments[0].click();", radio)
-                human_delay(0.3, 0.6)
-            
-            # 1. Click "Male" radio button
-            logger.info("Clicking 'Male' gender radio button")
-            click_radio_button("radio-text-gender-0-0")
-            logger.info("Gender selected successfully")
-            
-            # 2. Click "Single" marital status radio button
-            logger.info("Clicking 'Single' marital status radio button")
-            click_radio_button("radio-text-marital_status-0-0")
-            logger.info("Marital status selected successfully")
-            
-            # 3. Click "Good (680-719)" credit score radio button
-            logger.info("Clicking 'Good (680-719)' credit score radio button")
-            click_radio_button("radio-text-credit_score-0-1")
-            logger.info("Credit score selected successfully")
-            
-            # 4. Click "No diploma" education radio button (skip if already selected)
-            logger.info("Checking education radio button")
-            try:
-                education_radio = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '[data-cy="radio-text-education-0-0"]')))
-                # Check if already selected
-                parent_label = education_radio.find_element(By.XPATH, "./ancestor::label")
-                if "is-selected" not in parent_label.get_attribute("class"):
-                    click_radio_button("radio-text-education-0-0")
-                    logger.info("Education selected successfully")
-                else:
-                    logger.info("Education already selected, skipping")
-            except Exception as e:
-                logger.warning(f"Could not check/select education: {str(e)}")
-            
-            # 5. Fill employment dropdown: "Not employed within the last 12 months"
-            logger.info("Filling employment status dropdown")
-            if select_custom_dropdown(driver, wait, "dropdown-search-employment-0", "Not employed within the last 12 months", "Employment"):
-                logger.info("Employment status selected successfully")
-            else:
-                logger.warning("Could not select employment status, continuing...")
-            
-            # 6. Fill current carrier dropdown: "other"
-            logger.info("Filling current insurance company dropdown")
-            if select_custom_dropdown(driver, wait, "dropdown-search-current_carrier-0", "other", "Current Carrier"):
-                logger.info("Current carrier selected successfully")
-            else:
-                logger.warning("Could not select current carrier, continuing...")
-            
-            # 7. Click "Less than 6 months" insured length radio (skip if already selected)
-            logger.info("Checking insured length radio button")
-            try:
-                insured_length_radio = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '[data-cy="radio-text-insured_length-0-0"]')))
-                parent_label = insured_length_radio.find_element(By.XPATH, "./ancestor::label")
-                if "is-selected" not in parent_label.get_attribute("class"):
-                    click_radio_button("radio-text-insured_length-0-0")
-                    logger.info("Insured length selected successfully")
-                else:
-                    logger.info("Insured length already selected, skipping")
-            except Exception as e:
-                logger.warning(f"Could not check/select insured length: {str(e)}")
+            # Personal details, employment, insurance history, coverage and contact info
+            run_form_actions(driver, wait, STEP10_ACTIONS)
             
-            # 8. Click "$15k / $30k" bodily injury radio button
-            logger.info("Clicking '$15k / $30k' bodily injury radio button")
-            # Note: data-cy has special characters, use XPath or attribute contains
-            try:
-                # Try XPath first (handles special characters better)
-                bodily_injury_radio = wait.until(EC.element_to_be_clickable((By.XPATH, "//div[@data-cy='radio-text-current_bodily_injury_per_person-0-$15k / $30k']")))
-            except Exception:
-                # Fallback: try with contains
-                try:
-                    bodily_injury_radio = wait.until(EC.element_to_be_clickable((By.XPATH, "//div[contains(@data-cy, 'current_bodily_injury_per_person') and contains(@data-cy, '$15k')]")))
-                except Exception:
-                    # Last fallback: find by text content
-                    bodily_injury_radio = wait.until(EC.element_to_be_clickable((By.XPATH, "//div[contains(text(), '$15k / $30k')]")))
-            
-            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", bodily_injury_radio)
-            human_delay(0.3, 0.6)
-            human_mouse_move(driver, bodily_injury_radio)
-            human_delay(0.2, 0.4)
-            try:
-                bodily_injury_radio.click()
-            except Exception:
-                driver.execute_script("arguments[0].click();", bodily_injury_radio)
-            logger.info("Bodily injury coverage selected successfully")
-            human_delay(0.3, 0.6)
-            
-            # 9. Click "No" violations radio (skip if already selected)
-            logger.info("Checking violations radio button")
-            try:
-                violations_radio = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '[data-cy="radio-text-violations-0"]')))
-                parent_label = violations_radio.find_element(By.XPATH, "./ancestor::label")
-                if "is-selected" not in parent_label.get_attribute("class"):
-                    click_radio_button("radio-text-violations-0")
-                    logger.info("Violations selected successfully")
-                else:
-                    logger.info("Violations already selected, skipping")
-            except Exception as e:
-                logger.warning(f"Could not check/select violations: {str(e)}")
-            
-            # 10. Fill email: "moazam@gmail.com"
-            logger.info("Filling email field: moazam@gmail.com")
-            email_input = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '[data-cy="textinput-input-email-0"]')))
-            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", email_input)
-            human_delay(0.3, 0.6)
-            human_mouse_move(driver, email_input)
-            human_delay(0.2, 0.4)
-            email_input.click()
-            human_delay(0.2, 0.4)
-            
-            # Clear and type email
-            try:
-                email_input.clear()
-            except Exception:
-                email_input.send_keys(Keys.CONTROL + "a")
-                email_input.send_keys(Keys.DELETE)
-            human_delay(0.2, 0.4)
-            
-            email_value = "moazam@gmail.com"
-            for char in email_value:
-                try:
-                    email_input.send_keys(char)
-                except StaleElementReferenceException:
-                    email_input = driver.find_element(By.CSS_SELECTOR, '[data-cy="textinput-input-email-0"]')
-                    email_input.send_keys(char)
-                time.sleep(random.uniform(0.02, 0.08))
-            logger.info("Email entered successfully")
-            human_delay(0.5, 1.0)
-            
-            # 11. Fill phone: "2019756595"
-            logger.info("Filling phone number field: 2019756595")
-            phone_input = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '[data-cy="textinput-input-phone-number-input"]')))
-            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", phone_input)
-            human_delay(0.3, 0.6)
-            human_mouse_move(driver, phone_input)
-            human_delay(0.2, 0.4)
-            phone_input.click()
-            human_delay(0.2, 0.4)
-            
-            # Clear and type phone
-            try:
-                phone_input.clear()
-            except Exception:
-                phone_input.send_keys(Keys.CONTROL + "a")
-                phone_input.send_keys(Keys.DELETE)
-            human_delay(0.2, 0.4)
-            
-            phone_value = "2019756595"
-            for char in phone_value:
-                try:
-                    phone_input.send_keys(char)
-                except StaleElementReferenceException:
-                    phone_input = driver.find_element(By.CSS_SELECTOR, '[data-cy="textinput-input-phone-number-input"]')
-                    phone_input.send_keys(char)
-                time.sleep(random.uniform(0.02, 0.08))
-            logger.info("Phone number entered successfully")
-            human_delay(0.5, 1.0)
-            
-            # 12. Click "No" military affiliation radio button
-            logger.info("Clicking 'No' military affiliation radio button")
-            click_radio_button("radio-text-has_military_affiliation-false")
-            logger.info("Military affiliation selected successfully")
-            
-            # 13. Click "Save & continue" button and wait for new page
+            # Click "Save & continue" button and wait for new page
             logger.info("Looking for 'Save & continue' button")
             try:
-                # Wait for button to be present and enabled
-                save_button = wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '[data-cy="primary-button_section-continue"]'))
-                )
-                logger.info("Save & continue button found, waiting for it to be enabled...")
-                
-                # Wait for button to be enabled
-                max_wait_time = 10
-                start_time = time.time()
-                while time.time() - start_time < max_wait_time:
-                    try:
-                        disabled_attr = save_button.get_attribute("disabled")
-                        if disabled_attr is None:
-                            logger.info("Save & continue button is now enabled")
-                            break
-                        human_delay(0.5, 1.0)
-                        save_button = driver.find_element(By.CSS_SELECTOR, '[data-cy="primary-button_section-continue"]')
-                    except Exception:
-                        pass
-                
-                # Get the button element again to ensure it's clickable
-                save_button = wait.until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-cy="primary-button_section-continue"]'))
-                )
-                
-                # Human-like behavior: scroll to button and move mouse
-                driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", save_button)
-                human_delay(0.5, 1.0)
-                human_mouse_move(driver, save_button)
-                human_delay(0.4, 0.8)
-                
-                # Store current URL before clicking
-                url_before_click = driver.current_url
-                logger.info("Clicking Save & continue button...")
-                save_button.click()
-                logger.info("Save & continue button clicked successfully")
-                
-                # Wait for page to change (new page to load)
-                logger.info("Waiting for new page to load after clicking 'Save & continue'")
-                wait.until(lambda d: d.current_url != url_before_click)
-                logger.info("New page loaded")
-                
-                # Wait for page to fully render
-                human_delay(1.0, 1.5)
-                logger.info(f"Step 10 completed. New page URL: {driver.current_url}")
+                # Click Save & continue and wait for the next page
+                new_url = click_save_and_continue(driver, wait)
+                logger.info("Step 10 completed. New page URL: %s", new_url)
                 
             except Exception as e:
-                logger.error(f"Step 10 failed: Failed to find, enable, or click the 'Save & continue' button: {str(e)}")
+                logger.error("Step 10 failed: Failed to find, enable, or click the 'Save & continue' button: %s", e)
                 return {
                     "status": "error",
                     "message": f"Step 10 failed: Failed to find, enable, or click the 'Save & continue' button: {str(e)}",
@@ -1822,7 +2489,7 @@ async def start_bot(request: StartRequest):
                 }
             
         except Exception as e:
-            logger.error(f"Step 10 failed: {str(e)}", exc_info=True)
+            logger.error("Step 10 failed: %s", e, exc_info=True)
             return {
                 "status": "error",
                 "message": f"Step 10 failed: {str(e)}",
@@ -1835,39 +2502,25 @@ async def start_bot(request: StartRequest):
         try:
             # Find and click the "Show quotes at this coverage" button
             logger.info("Looking for 'Show quotes at this coverage' button")
-            show_quotes_button = wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-cy="primary-button_show-quotes-minimum-desktop"]'))
-            )
-            
-            # Scroll to button
-            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", show_quotes_button)
-            human_delay(0.5, 1.0)
-            human_mouse_move(driver, show_quotes_button)
-            human_delay(0.4, 0.8)
+            show_quotes_button = wait_for_element(driver, wait, SHOW_QUOTES_BUTTON, EC.element_to_be_clickable)
             
-            # Store current URL before clicking
-            url_before_click = driver.current_url
+            # Mark the current page so the navigation the click triggers can be detected in-page
+            mark_navigation(driver)
             logger.info("Clicking 'Show quotes at this coverage' button...")
-            
-            try:
-                show_quotes_button.click()
-            except Exception:
-                # If click fails, use JavaScript click
-                driver.execute_script("arguments[0].click();", show_quotes_button)
+            fast_click(driver, show_quotes_button)
             
             logger.info("'Show quotes at this coverage' button clicked successfully")
             
             # Wait for page to change (new page to load)
             logger.info("Waiting for new page to load after clicking 'Show quotes at this coverage'")
-            wait.until(lambda d: d.current_url != url_before_click)
+            wait_for_navigation(driver)
             logger.info("New page loaded")
             
-            # Wait for page to fully render
-            human_delay(1.5, 2.5)  # Wait longer for quotes page to load
-            logger.info(f"Step 11 completed. New page URL: {driver.current_url}")
+            # The quote cards themselves are awaited by scrape_quotes_from_page
+            logger.info("Step 11 completed. New page URL: %s", driver.current_url)
             
         except Exception as e:
-            logger.error(f"Step 11 failed: {str(e)}", exc_info=True)
+            logger.error("Step 11 failed: %s", e, exc_info=True)
             return {
                 "status": "error",
                 "message": f"Step 11 failed: Failed to click 'Show quotes at this coverage' button: {str(e)}",
@@ -1875,72 +2528,6 @@ async def start_bot(request: StartRequest):
                 "full_error": str(e)
             }
         
-        # Helper function to extract plan details (Bodily Injury and Comprehensive deductible)
-        def extract_plan_details(plan_data_cy):
-            """Extract Bodily Injury and Comprehensive deductible from a plan card."""
-            bi_value = None
-            comprehensive_deductible = None
-            
-            try:
-                plan_card = driver.find_element(By.CSS_SELECTOR, f'[data-cy="{plan_data_cy}"]')
-                
-                # Find the flex-column container that holds all the plan details
-                try:
-                    flex_container = plan_card.find_element(By.CSS_SELECTOR, ".d-flex.flex-column")
-                except Exception:
-                    # Fallback: try to find it by class
-                    flex_container = plan_card.find_element(By.XPATH, ".//div[contains(@class, 'flex-column')]")
-                
-                # Get all child divs to find the structure
-                all_divs = flex_container.find_elements(By.XPATH, "./div")
-                
-                # Method: Find the index of label divs and get the next text-bold div
-                for i, div in enumerate(all_divs):
-                    div_text = div.text.strip()
-                    div_class = div.get_attribute('class') or ''
-                    
-                    # Check if this is the Bodily Injury label
-                    if 'Bodily Injury' in div_text and 'BI' in div_text:
-                        # Next div should be the BI value
-                        if i + 1 < len(all_divs):
-                            next_div = all_divs[i + 1]
-                            next_class = next_div.get_attribute('class') or ''
-                            if 'text-bold' in next_class:
-                                bi_value = next_div.text.strip()
-                                logger.info(f"Extracted BI value: {bi_value}")
-                    
-                    # Check if this is the Comprehensive + Collision label
-                    if 'Comprehensive' in div_text and 'Collision' in div_text:
-                        # Next div should be the comprehensive deductible
-                        if i + 1 < len(all_divs):
-                            next_div = all_divs[i + 1]
-                            next_class = next_div.get_attribute('class') or ''
-                            if 'text-bold' in next_class:
-                                comprehensive_deductible = next_div.text.strip()
-                                logger.info(f"Extracted Comprehensive deductible: {comprehensive_deductible}")
-                
-                # Fallback: Try XPath if the above method didn't work
-                if not bi_value:
-                    try:
-                        bi_section = plan_card.find_element(By.XPATH, ".//div[contains(text(), 'Bodily Injury (BI)')]/following-sibling::div[contains(@class, 'text-bold')]")
-                        bi_value = bi_section.text.strip()
-                        logger.info(f"Extracted BI value (XPath fallback): {bi_value}")
-                    except Exception:
-                        pass
-                
-                if not comprehensive_deductible:
-                    try:
-                        comp_section = plan_card.find_element(By.XPATH, ".//div[contains(text(), 'Comprehensive + Collision')]/following-sibling::div[contains(@class, 'text-bold')]")
-                        comprehensive_deductible = comp_section.text.strip()
-                        logger.info(f"Extracted Comprehensive deductible (XPath fallback): {comprehensive_deductible}")
-                    except Exception:
-                        pass
-                    
-            except Exception as e:
-                logger.warning(f"Could not find plan card with data-cy='{plan_data_cy}': {str(e)}")
-            
-            return bi_value, comprehensive_deductible
-        
         # Helper function to scrape quotes from current page
         def scrape_quotes_from_page(plan_type, bodily_injury_value, comprehensive_deductible=None):
             """Scrape quotes from the current page."""
@@ -1949,183 +2536,65 @@ async def start_bot(request: StartRequest):
             # Wait for quotes to load - try both old and new structures
             logger.info("Waiting for quote cards to load...")
             try:
-                # Try waiting for either old or new card structure
-                wait.until(EC.any_of(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '[data-cy*="results-card_carrierCard"]')),
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '[data-cy="results-card_price"]')),
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '.results-card-v2__body'))
-                ))
+                # Wait once for a card or price of either structure; the selector list is
+                # matched in-page by a single query
+                wait_for_element(driver, wait, (By.CSS_SELECTOR, f'{QUOTE_CARD_CSS}, {QUOTE_PRICE_CSS}'), EC.presence_of_element_located)
                 logger.info("Quote cards found, waiting for prices to load...")
             except Exception:
                 logger.warning("Quote cards not found immediately, continuing anyway...")
             
-            human_delay(4.0, 6.0)  # Wait longer for all cards and prices to fully render
+            # Carriers' prices stream in over several renders; wait until one is shown, no
+            # loading indicator is visible and the list has stopped changing
+            if not await_dom_quiet(driver, QUOTE_PRICE_CSS, QUOTE_QUIET_MS, QUOTE_SETTLE_TIMEOUT_MS, QUOTE_LOADING_CSS):
+                logger.warning("Quote prices still loading after %ss, scraping what is shown", QUOTE_SETTLE_TIMEOUT_MS // 1000)
             
-            # Find all quote cards - try both old and new structures
+            # Read every card's company and price with one script call instead of a chain of
+            # WebDriver lookups per card
             logger.info("Finding all quote cards...")
-            quote_cards = []
-            
-            # Try new structure first (results-card-v2)
             try:
-                quote_cards = driver.find_elements(By.CSS_SELECTOR, '.results-card-v2__body')
-                logger.info(f"Found {len(quote_cards)} cards using new structure (.results-card-v2__body)")
-            except Exception:
-                pass
-            
-            # If no cards found, try old structure
-            if not quote_cards:
-                try:
-                    quote_cards = driver.find_elements(By.CSS_SELECTOR, '[data-cy*="results-card_carrierCard"]')
-                    logger.info(f"Found {len(quote_cards)} cards using old structure (results-card_carrierCard)")
-                except Exception:
-                    pass
-            
-            # If still no cards, try finding by price elements and getting parent
-            if not quote_cards:
-                try:
-                    price_elements = driver.find_elements(By.CSS_SELECTOR, '[data-cy="results-card_price"]')
-                    if price_elements:
-                        quote_cards = []
-                        for price_elem in price_elements:
-                            try:
-                                parent_card = price_elem.find_element(By.XPATH, "./ancestor::div[contains(@class, 'results-card') or contains(@class, 'card-body')]")
-                                quote_cards.append(parent_card)
-                            except Exception:
-                                continue
-                        logger.info(f"Found {len(quote_cards)} cards by finding price elements first")
-                except Exception:
-                    pass
-            
-            logger.info(f"Total found: {len(quote_cards)} quote cards")
-            
-            for idx, card in enumerate(quote_cards):
-                try:
-                    # Scroll to card to ensure it's loaded
-                    driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", card)
-                    human_delay(0.5, 1.0)
-                    
-                    # Extract company name - try both old and new structures
-                    company_name = "Unknown"
-                    try:
-                        # Try new structure first
-                        try:
-                            logo_img = card.find_element(By.CSS_SELECTOR, 'img[data-cy="results-card_logo"]')
-                        except Exception:
-                            # Try old structure
-                            logo_img = card.find_element(By.CSS_SELECTOR, 'img[data-cy*="card-logo"]')
-                        
-                        alt_text = logo_img.get_attribute("alt") or ""
-                        company_name = alt_text.replace(" logo", "").replace("Logo", "").replace("logo", "").strip()
-                        if not company_name:
-                            company_name = "Unknown"
-                    except Exception:
-                        pass
-                    
-                    # Try to find price - try both old and new structures
-                    price = None
-                    amount = None
-                    
-                    # Method 1: Try new structure (results-card-v2)
-                    try:
-                        price_elem = card.find_element(By.CSS_SELECTOR, '[data-cy="results-card_price"]')
-                        amount_text = price_elem.text.strip()
-                        
-                        if amount_text:
-                            # Get period from sibling
-                            try:
-                                period_elem = card.find_element(By.CSS_SELECTOR, '.results-card-v2__currency--period')
-                                period = period_elem.text.strip()
-                            except Exception:
-                                period = "/mo"  # Default for new structure
-                            
-                            amount = amount_text.replace("$", "").replace(",", "").strip()
-                            price = f"${amount_text}{period}".strip()
-                            logger.info(f"Card {idx + 1} ({company_name}) - Found price (new structure): {price}")
-                    except Exception:
-                        pass
-                    
-                    # Method 2: Try old structure (rate elements)
-                    if not price or not amount:
-                        try:
-                            rate_elements = card.find_elements(By.XPATH, ".//div[contains(@class, 'rate')]")
-                            for rate_elem in rate_elements:
-                                try:
-                                    amount_elem = rate_elem.find_element(By.CSS_SELECTOR, '.rate__amount')
-                                    amount_text = amount_elem.text.strip()
-                                    
-                                    if amount_text:
-                                        try:
-                                            dollar_elem = rate_elem.find_element(By.CSS_SELECTOR, '.rate__dollar')
-                                            dollar_sign = dollar_elem.text.strip() or "$"
-                                        except Exception:
-                                            dollar_sign = "$"
-                                        
-                                        try:
-                                            period_elem = rate_elem.find_element(By.CSS_SELECTOR, '.rate__period')
-                                            period = period_elem.text.strip()
-                                        except Exception:
-                                            period = ""
-                                        
-                                        amount = amount_text
-                                        price = f"{dollar_sign}{amount}{period}".strip()
-                                        logger.info(f"Card {idx + 1} ({company_name}) - Found price (old structure): {price}")
-                                        break
-                                except Exception:
-                                    continue
-                        except Exception:
-                            pass
-                    
-                    # Method 3: Try CSS selector search for old structure
-                    if not price or not amount:
-                        try:
-                            rate_amount_elements = card.find_elements(By.CSS_SELECTOR, '.rate__amount')
-                            for rate_amount_elem in rate_amount_elements:
-                                amount_text = rate_amount_elem.text.strip()
-                                if amount_text:
-                                    try:
-                                        rate_container = rate_amount_elem.find_element(By.XPATH, "./ancestor::div[contains(@class, 'rate')]")
-                                        
-                                        try:
-                                            dollar_elem = rate_container.find_element(By.CSS_SELECTOR, '.rate__dollar')
-                                            dollar_sign = dollar_elem.text.strip() or "$"
-                                        except Exception:
-                                            dollar_sign = "$"
-                                        
-                                        try:
-                                            period_elem = rate_container.find_element(By.CSS_SELECTOR, '.rate__period')
-                                            period = period_elem.text.strip()
-                                        except Exception:
-                                            period = ""
-                                        
-                                        amount = amount_text
-                                        price = f"{dollar_sign}{amount}{period}".strip()
-                                        logger.info(f"Card {idx + 1} ({company_name}) - Found price via CSS: {price}")
-                                        break
-                                    except Exception:
-                                        continue
-                        except Exception:
-                            pass
-                    
-                    # Only add to results if price is not null
-                    if price:
-                        quote_data = {
-                            "company": company_name,
-                            "price": price,
-                            "bodily_injury": bodily_injury_value,
-                            "comprehensive_deductible": comprehensive_deductible,
-                            "plan_type": plan_type
-                        }
-                        scraped_quotes.append(quote_data)
-                        logger.info(f"Scraped quote {len(scraped_quotes)}: {company_name} - {price} (BI: {bodily_injury_value}, Comp: {comprehensive_deductible})")
-                    else:
-                        logger.info(f"Skipping quote for {company_name} - No price available")
-                        
-                except Exception as e:
-                    logger.warning(f"Error scraping card {idx + 1}: {str(e)}")
-                    continue
+                cards = driver.execute_script(EXTRACT_QUOTE_CARDS_JS, QUOTE_CARD_SELECTORS) or []
+            except WebDriverException as e:
+                logger.warning("Could not read quote cards: %s", e)
+                cards = []
+            logger.info("Total found: %s quote cards", len(cards))
+            
+            # Per-card lines are DEBUG only; checked once so the loop skips the logging
+            # calls entirely at the default INFO level
+            log_cards = logger.isEnabledFor(logging.DEBUG)
+            for idx, card in enumerate(cards):
+                company_name = card.get("company") or "Unknown"
+                price = card.get("price")
+                
+                # Only add to results if price is not null
+                if price:
+                    quote_data = {
+                        "company": company_name,
+                        "price": price,
+                        "bodily_injury": bodily_injury_value,
+                        "comprehensive_deductible": comprehensive_deductible,
+                        "plan_type": plan_type
+                    }
+                    scraped_quotes.append(quote_data)
+                    if log_cards:
+                        logger.debug("Card %s (%s) - Scraped price (%s): %s", idx + 1, company_name, card.get("structure"), price)
+                elif log_cards:
+                    logger.debug("Card %s (%s) - Skipped, no price available", idx + 1, company_name)
             
+            logger.info("Scraped %s priced quotes from %s cards (%s plan, BI: %s, Comp: %s)", len(scraped_quotes), len(cards), plan_type, bodily_injury_value, comprehensive_deductible)
             return scraped_quotes
         
+        # Helper function to switch the results page to another coverage plan
+        def switch_plan(plan_radio, plan_name):
+            """Click a plan's radio and wait for the shown prices to change."""
+            # Snapshot the prices so the switch is detected whether the cards re-render or
+            # update in place; scrape_quotes_from_page then waits for the new list to settle
+            old_prices = driver.execute_script(SELECTOR_TEXT_JS, QUOTE_PRICE_CSS)
+            fast_click(driver, plan_radio)
+            
+            logger.info("%s plan clicked successfully", plan_name)
+            if old_prices and not await_text_change(driver, QUOTE_PRICE_CSS, old_prices, PLAN_SWITCH_TIMEOUT_MS):
+                logger.warning("Prices did not change within %ss of switching to the %s plan", PLAN_SWITCH_TIMEOUT_MS // 1000, plan_name)
+        
         # Step 12: Scrape quote data from minimum plan
         logger.info("Step 12: Scraping quote data from minimum plan")
         minimum_quotes = []
@@ -2136,15 +2605,17 @@ async def start_bot(request: StartRequest):
             # Set hardcoded plan details for minimum plan
             minimum_bi_value = "$15k/$30k"
             minimum_comp_deductible = "0"
-            logger.info(f"Minimum plan - BI: {minimum_bi_value}, Comprehensive: {minimum_comp_deductible}")
+            logger.info("Minimum plan - BI: %s, Comprehensive: %s", minimum_bi_value, minimum_comp_deductible)
             
             # Scrape minimum plan quotes
             minimum_quotes = scrape_quotes_from_page("minimum", minimum_bi_value, minimum_comp_deductible)
-            logger.info(f"Step 12 completed. Scraped {len(minimum_quotes)} quotes from minimum plan")
+            logger.info("Step 12 completed. Scraped %s quotes from minimum plan", len(minimum_quotes))
             
         except Exception as e:
-            logger.error(f"Step 12 failed: {str(e)}", exc_info=True)
+            logger.error("Step 12 failed: %s", e, exc_info=True)
             minimum_quotes = []
+        if on_plan:
+            on_plan("minimum", minimum_quotes)
         
         # Step 13: Click Basic plan and scrape quotes
         logger.info("Step 13: Clicking Basic plan and scraping quotes")
@@ -2152,35 +2623,26 @@ async def start_bot(request: StartRequest):
         try:
             # Click the Basic plan radio button
             logger.info("Clicking Basic plan radio button")
-            basic_plan_radio = wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-cy="basic-coverage-card-container"]'))
-            )
-            
-            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", basic_plan_radio)
-            human_delay(0.3, 0.6)
-            human_mouse_move(driver, basic_plan_radio)
-            human_delay(0.2, 0.4)
-            
-            try:
-                basic_plan_radio.click()
-            except Exception:
-                driver.execute_script("arguments[0].click();", basic_plan_radio)
+            # The plan cards render with the results, which step 12 already waited for, so
+            # a missing card fails after the short timeout instead of the full one
+            basic_plan_radio = wait_for_element(driver, quick_wait, BASIC_PLAN_CARD, EC.element_to_be_clickable, QUICK_WAIT_TIMEOUT)
             
-            logger.info("Basic plan clicked successfully")
-            human_delay(2.0, 3.0)  # Wait for new cards to load
+            switch_plan(basic_plan_radio, "Basic")
             
             # Set hardcoded plan details for basic plan
             basic_bi_value = "$25k/$50k"
             basic_comp_deductible = "1000"
-            logger.info(f"Basic plan - BI: {basic_bi_value}, Comprehensive: {basic_comp_deductible}")
+            logger.info("Basic plan - BI: %s, Comprehensive: %s", basic_bi_value, basic_comp_deductible)
             
             # Scrape Basic plan quotes
             basic_quotes = scrape_quotes_from_page("basic", basic_bi_value, basic_comp_deductible)
-            logger.info(f"Step 13 completed. Scraped {len(basic_quotes)} quotes from Basic plan")
+            logger.info("Step 13 completed. Scraped %s quotes from Basic plan", len(basic_quotes))
             
         except Exception as e:
-            logger.error(f"Step 13 failed: {str(e)}", exc_info=True)
+            logger.error("Step 13 failed: %s", e, exc_info=True)
             basic_quotes = []
+        if on_plan:
+            on_plan("basic", basic_quotes)
         
         # Step 14: Click Better plan and scrape quotes
         logger.info("Step 14: Clicking Better plan and scraping quotes")
@@ -2189,53 +2651,30 @@ async def start_bot(request: StartRequest):
             # Click the Better plan radio button
             logger.info("Clicking Better plan radio button")
             try:
-                better_plan_radio = wait.until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-cy="better-coverage-card-container"]'))
-                )
+                better_plan_radio = wait_for_element(driver, quick_wait, BETTER_PLAN_CARD, EC.element_to_be_clickable, QUICK_WAIT_TIMEOUT)
             except Exception:
                 # Fallback: find by text content "Better"
-                better_plan_radio = wait.until(
-                    EC.element_to_be_clickable((By.XPATH, "//div[contains(@class, 'coverage-card-title') and contains(text(), 'Better')]/ancestor::label[contains(@class, 'custom-radio')]"))
-                )
-            
-            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", better_plan_radio)
-            human_delay(0.3, 0.6)
-            human_mouse_move(driver, better_plan_radio)
-            human_delay(0.2, 0.4)
-            
-            try:
-                better_plan_radio.click()
-            except Exception:
-                driver.execute_script("arguments[0].click();", better_plan_radio)
+                better_plan_radio = quick_wait.until(EC.element_to_be_clickable(BETTER_PLAN_CARD_FALLBACK))
             
-            logger.info("Better plan clicked successfully")
-            human_delay(2.0, 3.0)  # Wait for new cards to load
+            switch_plan(better_plan_radio, "Better")
             
             # Set hardcoded plan details for better plan
             better_bi_value = "$50k/$100k"
             better_comp_deductible = "1000"
-            logger.info(f"Better plan - BI: {better_bi_value}, Comprehensive: {better_comp_deductible}")
+            logger.info("Better plan - BI: %s, Comprehensive: %s", better_bi_value, better_comp_deductible)
             
             # Scrape Better plan quotes
             better_quotes = scrape_quotes_from_page("better", better_bi_value, better_comp_deductible)
-            logger.info(f"Step 14 completed. Scraped {len(better_quotes)} quotes from Better plan")
+            logger.info("Step 14 completed. Scraped %s quotes from Better plan", len(better_quotes))
             
         except Exception as e:
-            logger.error(f"Step 14 failed: {str(e)}", exc_info=True)
+            logger.error("Step 14 failed: %s", e, exc_info=True)
             better_quotes = []
+        if on_plan:
+            on_plan("better", better_quotes)
         
         logger.info("All steps (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14) completed successfully")
         
-        # Close the browser after all steps are completed
-        logger.info("Closing browser after completing all steps")
-        try:
-            if driver is not None:
-                driver.quit()
-                driver = None
-                logger.info("Browser closed successfully")
-        except Exception as e:
-            logger.warning(f"Error closing browser: {str(e)}")
-        
         return {
             "minimum_plan_quotes": minimum_quotes,
             "basic_plan_quotes": basic_quotes,
@@ -2245,16 +2684,7 @@ async def start_bot(request: StartRequest):
             "better_quotes_count": len(better_quotes)
         }
     except Exception as e:
-        logger.error(f"Unexpected error in start_bot: {str(e)}", exc_info=True)
-        
-        # Close the browser even if there was an error
-        try:
-            if driver is not None:
-                driver.quit()
-                driver = None
-                logger.info("Browser closed after error")
-        except Exception:
-            pass
+        logger.error("Unexpected error in start_bot: %s", e, exc_info=True)
         
         return {
             "status": "error",
@@ -2266,23 +2696,25 @@ async def start_bot(request: StartRequest):
 @app.get("/status")
 async def get_status():
     """
-    Get the current status of the browser session.
+    Get the current status of the most recently started browser session.
     
     Returns:
         dict: Current browser status
     """
-    global driver
-    
-    if driver is None:
-        return {"status": "no_browser", "message": "No browser session active"}
+    with active_drivers_lock:
+        if not active_drivers:
+            return {"status": "no_browser", "message": "No browser session active"}
+        driver = active_drivers[-1]
+        active_sessions = len(active_drivers)
     
     try:
-        current_url = driver.current_url
-        title = driver.title
+        # Each property is a WebDriver round trip, so read them off the event loop
+        current_url, title = await asyncio.to_thread(lambda: (driver.current_url, driver.title))
         return {
             "status": "active",
             "current_url": current_url,
-            "title": title
+            "title": title,
+            "active_sessions": active_sessions
         }
     except Exception as e:
         return {
@@ -2294,33 +2726,64 @@ async def get_status():
 @app.post("/stop")
 async def stop_bot():
     """
-    Stop the bot and close the browser.
+    Stop every running bot and close their browsers.
     
     Returns:
         dict: Status message
     """
-    global driver
+    with active_drivers_lock:
+        drivers = list(active_drivers)
     
-    if driver is None:
+    if not drivers:
         return {"status": "no_browser", "message": "No browser session to close"}
     
-    try:
-        driver.quit()
-        driver = None
-        return {"status": "success", "message": "Browser closed successfully"}
-    except Exception as e:
-        return {"status": "error", "message": f"Error closing browser: {str(e)}"}
+    def quit_all() -> list:
+        # Each running flow fails on its next command and the pool discards its browser.
+        # A browser that already crashed must not stop the rest from being closed.
+        errors = []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.warning("Error closing browser: %s", e)
+                errors.append(str(e))
+        return errors
+    
+    # quit() blocks until Chrome exits, so keep it off the event loop
+    errors = await asyncio.to_thread(quit_all)
+    if errors:
+        return {"status": "error", "message": f"Error closing {len(errors)} of {len(drivers)} browser(s): {'; '.join(errors)}"}
+    return {"status": "success", "message": f"Closed {len(drivers)} browser(s) successfully"}
+
+
+@app.on_event("startup")
+async def startup_event():
+    """Pre-warm the browser pool in the background if DRIVER_PREWARM is set."""
+    if DRIVER_PREWARM:
+        # Keep a reference so the task isn't garbage-collected before it finishes
+        app.state.prewarm_task = asyncio.create_task(asyncio.to_thread(driver_pool.warm))
+        app.state.prewarm_task.add_done_callback(_log_prewarm_failure)
+
+
+def _log_prewarm_failure(task: asyncio.Task):
+    """Log an exception raised by the pre-warm task, which nothing else awaits."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Browser pool pre-warm failed: %s", task.exception(), exc_info=task.exception())
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Clean up browser instance on application shutdown."""
-    global driver
-    if driver is not None:
+    """Clean up browser instances on application shutdown."""
+    with active_drivers_lock:
+        drivers = list(active_drivers)
+    for driver in drivers:
         try:
             driver.quit()
         except Exception:
             pass
+    driver_pool.close()
+    bot_executor.shutdown(wait=False)
+    reset_executor.shutdown(wait=False)
 
 
 if __name__ == "__main__":